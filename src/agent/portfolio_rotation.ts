@@ -4,11 +4,14 @@
  */
 
 import { Portfolio } from '../models/portfolio.js';
+import { Trade } from '../models/trade.js';
 import { MarketData } from '../data/market_data.js';
 import { WatchlistManager } from '../data/watchlist.js';
-import { Scanner } from './scanner.js';
-import { Scorer } from './scorer.js';
+import { Scanner, scanner } from './scanner.js';
+import { Scorer, Score, scorer } from './scorer.js';
 import { RotationEngine } from './rotation_engine.js';
+import { calculateIndicators } from '../utils/indicators.js';
+import { getConfig } from '../config.js';
 
 export interface AgentState {
   portfolio: Portfolio;
@@ -17,33 +20,35 @@ export interface AgentState {
   lastUpdate: Date;
 }
 
+export interface AgentPerformance {
+  totalValue: number;
+  cash: number;
+  unrealizedPnL: number;
+  unrealizedPnLPercent: number;
+  maxDrawdown: number;
+}
+
 export interface AgentOutput {
   state: AgentState;
-  trades: any[];
-  performance: {
-    totalValue: number;
-    cash: number;
-    unrealizedPnL: number;
-    unrealizedPnLPercent: number;
-    maxDrawdown: number;
-  };
+  trades: readonly Trade[];
+  performance: AgentPerformance;
 }
 
 export class PortfolioRotationAgent {
   private portfolio: Portfolio;
-  private marketData: MarketData;
-  private watchlistManager: WatchlistManager;
-  private scanner: Scanner;
-  private scorer: Scorer;
-  private rotationEngine: RotationEngine;
-  private fmpService: any;
+  private readonly marketData: MarketData;
+  private readonly watchlistManager: WatchlistManager;
+  private readonly scanner: Scanner;
+  private readonly scorer: Scorer;
+  private readonly rotationEngine: RotationEngine;
+  private readonly fmpService: any;
 
   constructor(initialCapital: number = 10000, options?: { fmpService?: any }) {
     this.portfolio = new Portfolio(initialCapital);
     this.marketData = new MarketData();
     this.watchlistManager = new WatchlistManager();
-    this.scanner = new Scanner();
-    this.scorer = new Scorer();
+    this.scanner = scanner;
+    this.scorer = scorer;
     this.rotationEngine = new RotationEngine();
     this.fmpService = options?.fmpService || null;
   }
@@ -74,6 +79,7 @@ export class PortfolioRotationAgent {
    */
   async analyzeWatchlist(watchlist: string[]): Promise<{
     scores: Map<string, number>;
+    scoreDetails: Map<string, Score>;
     rotationDecisions: any[];
   }> {
     const scores = new Map<string, number>();
@@ -83,8 +89,13 @@ export class PortfolioRotationAgent {
       watchlist.map((ticker) => this.marketData.fetchCandles(ticker))
     );
 
-    // Scan for catalysts
-    const catalysts = this.scanner.scanMultiple(candlesList);
+    // Compute RSI/MACD/volume once per ticker; the scanner and scorer both read them
+    const indicatorsList = candlesList.map((candles) =>
+      calculateIndicators(candles.prices, candles.volumes)
+    );
+
+    // Scan for catalysts (tickers that can't reach the configured strength stop at the price signals)
+    const catalysts = this.scanner.scanMultiple(candlesList, indicatorsList, getConfig().minCatalystStrength);
 
     // Fetch analyst target prices from FMP if available
     const targetPrices = new Map<string, number>();
@@ -100,32 +111,20 @@ export class PortfolioRotationAgent {
       await Promise.all(targetPromises);
     }
 
-    // Score each ticker
-    for (let i = 0; i < candlesList.length; i++) {
-      const candles = candlesList[i];
-      const catalyst = catalysts[i];
-      const analystTarget = targetPrices.get(candles.ticker);
-      const score = this.scorer.scoreTickerWithCandles(
-        candles.ticker,
-        candles,
-        catalyst,
-        analystTarget
-      );
+    // Score all tickers in one batch, keeping full scores for the rotation engine
+    const scoreMap = new Map<string, Score>();
+    for (const score of this.scorer.scoreBatch(candlesList, catalysts, targetPrices, indicatorsList)) {
       scores.set(score.ticker, score.expectedReturn);
+      scoreMap.set(score.ticker, score);
     }
 
     // Determine rotation decisions
     const rotationDecisions = this.rotationEngine.decideRotation(
       this.portfolio,
-      new Map(
-        Array.from(scores.entries()).map(([ticker, score]) => [
-          ticker,
-          { ticker, expectedReturn: score, components: {} as any },
-        ])
-      )
+      scoreMap
     );
 
-    return { scores, rotationDecisions };
+    return { scores, scoreDetails: scoreMap, rotationDecisions };
   }
 
   /**
@@ -153,6 +152,21 @@ export class PortfolioRotationAgent {
     };
   }
 
+  /**
+   * Get performance summary only
+   * Cheaper than getAgentOutput() for callers that never read state or trades.
+   */
+  getPerformance(): AgentPerformance {
+    return this.portfolio.getSummary();
+  }
+
+  /**
+   * Get trade history
+   */
+  getTrades(): readonly Trade[] {
+    return this.portfolio.getTrades();
+  }
+
   /**
    * Get agent output for reporting
    */
@@ -167,13 +181,7 @@ export class PortfolioRotationAgent {
         lastUpdate: new Date(),
       },
       trades: portfolio.getTrades(),
-      performance: {
-        totalValue: portfolio.getTotalValue(),
-        cash: portfolio.getCash(),
-        unrealizedPnL: portfolio.getUnrealizedPnL(),
-        unrealizedPnLPercent: portfolio.getUnrealizedPnLPercent(),
-        maxDrawdown: portfolio.getMaxDrawdown(),
-      },
+      performance: this.getPerformance(),
     };
   }
 }
@@ -0,0 +1,30 @@
+/**
+ * AC-3: Position Sizer Tests
+ * Validates whole-share allocation
+ * Links to PRD SE-3 (Position sizing)
+ */
+
+import { describe, it, expect } from 'vitest';
+import { PositionSizer } from './position_sizer.js';
+
+describe('PositionSizer (AC-3)', () => {
+  // Stateless: one instance serves every test
+  const sizer = new PositionSizer();
+
+  it('should floor to whole shares of the budgeted capital', () => {
+    expect(sizer.calculateShares(10000, 150, 0.7)).toBe(46); // floor(7000 / 150)
+    expect(sizer.calculateShares(5250, 200)).toBe(26); // floor(26.25), full budget by default
+    expect(sizer.calculateShares(100, 150)).toBe(0); // Can't afford one share
+  });
+
+  it('should clamp a negative budget to zero shares', () => {
+    expect(sizer.calculateShares(-500, 10)).toBe(0);
+    expect(sizer.calculateShares(10000, 10, -0.5)).toBe(0);
+  });
+
+  it('should reject zero, missing and negative prices', () => {
+    expect(sizer.calculateShares(10000, 0)).toBe(0);
+    expect(sizer.calculateShares(10000, NaN)).toBe(0);
+    expect(sizer.calculateShares(10000, -50)).toBe(0);
+  });
+});
@@ -0,0 +1,17 @@
+/**
+ * Position Sizer - Share Allocation
+ * Links to PRD SE-3 (Position sizing) and spec Section 7 (Trade Execution)
+ */
+
+export class PositionSizer {
+  /**
+   * Whole shares purchasable with a fraction of the given capital
+   * Non-positive or non-finite inputs yield 0 shares (never negative).
+   */
+  calculateShares(capital: number, sharePrice: number, fraction: number = 1): number {
+    // Clamp the budget, not the result: a negative budget floors straight to 0 shares
+    const shares = Math.floor(Math.max(capital * fraction, 0) / sharePrice);
+    // NaN/Infinity (zero or missing price) and negative prices fail this check
+    return shares > 0 && shares < Infinity ? shares : 0;
+  }
+}
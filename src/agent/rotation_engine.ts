@@ -5,6 +5,8 @@
 
 import { Portfolio } from '../models/portfolio.js';
 import { Score } from './scorer.js';
+import { PositionSizer } from './position_sizer.js';
+import { getConfig } from '../config.js';
 
 export interface RotationDecision {
   shouldRotate: boolean;
@@ -23,9 +25,18 @@ export interface RotationExecutionResult {
 }
 
 export class RotationEngine {
-  private rotationThreshold = 0.02; // 2% differential per spec
-  private stopLossPercent = -15; // Per spec Section 6
-  private maxDrawdown = -30; // Circuit breaker per spec
+  private readonly rotationThreshold: number; // 2% differential per spec
+  private readonly stopLossPercent: number; // -15% per spec Section 6
+  private readonly maxDrawdown: number; // -30% circuit breaker per spec
+  private readonly positionSizer: PositionSizer;
+
+  constructor() {
+    const config = getConfig();
+    this.positionSizer = new PositionSizer();
+    this.rotationThreshold = config.rotationThreshold;
+    this.stopLossPercent = config.stopLossPercent;
+    this.maxDrawdown = config.maxDrawdown;
+  }
 
   /**
    * Decide whether to rotate based on score differentials
@@ -38,9 +49,24 @@ export class RotationEngine {
     const decisions: RotationDecision[] = [];
     const positions = portfolio.getPositions();
 
+    // The best rotation target is the same for every position (the highest
+    // score not already held), so find it once instead of per position
+    const heldTickers = new Set(portfolio.getTickers());
+    const { rotationThreshold, stopLossPercent } = this;
+    let bestCandidate: Score | undefined;
+    for (const [ticker, score] of scores) {
+      // Don't rotate to a position already held
+      if (heldTickers.has(ticker)) {
+        continue;
+      }
+      if (!bestCandidate || score.expectedReturn > bestCandidate.expectedReturn) {
+        bestCandidate = score;
+      }
+    }
+
     for (const position of positions) {
       // Check for stop-loss first
-      if (position.isStopLossHit(this.stopLossPercent)) {
+      if (position.isStopLossHit(stopLossPercent)) {
         decisions.push({
           shouldRotate: true,
           fromTicker: position.ticker,
@@ -49,32 +75,16 @@ export class RotationEngine {
         continue;
       }
 
-      // Find best candidate to rotate into
       const currentScore = scores.get(position.ticker)?.expectedReturn ?? 0;
-      let bestCandidate: Score | undefined;
-      let bestDifference = this.rotationThreshold;
-
-      for (const [ticker, score] of scores.entries()) {
-        // Don't rotate to a position already held
-        if (portfolio.getTickers().includes(ticker)) {
-          continue;
-        }
+      const difference = bestCandidate ? bestCandidate.expectedReturn - currentScore : 0;
 
-        const difference = score.expectedReturn - currentScore;
-
-        if (difference > bestDifference) {
-          bestDifference = difference;
-          bestCandidate = score;
-        }
-      }
-
-      if (bestCandidate && bestCandidate.expectedReturn > currentScore + this.rotationThreshold) {
+      if (bestCandidate && difference > rotationThreshold) {
         decisions.push({
           shouldRotate: true,
           fromTicker: position.ticker,
           toTicker: bestCandidate.ticker,
           reason: 'SCORE_DIFFERENTIAL',
-          scoreDifference: bestDifference,
+          scoreDifference: difference,
         });
       }
     }
@@ -96,69 +106,74 @@ export class RotationEngine {
 
   /**
    * Execute a rotation decision
+   * @param timestamp Time recorded on the resulting trades; defaults to now
    */
   executeRotation(
     portfolio: Portfolio,
     decision: RotationDecision,
-    priceMap: Map<string, number>
+    priceMap: Map<string, number>,
+    timestamp: Date = new Date()
   ): RotationExecutionResult {
-    if (!decision.shouldRotate || !decision.fromTicker) {
+    const { fromTicker, toTicker, reason } = decision;
+    if (!decision.shouldRotate || !fromTicker) {
       return { executed: false };
     }
 
-    const fromPrice = priceMap.get(decision.fromTicker);
+    const fromPrice = priceMap.get(fromTicker);
     if (!fromPrice) {
       return {
         executed: false,
-        reason: `No price for ${decision.fromTicker}`,
+        reason: `No price for ${fromTicker}`,
       };
     }
 
     // Handle stop-loss or circuit breaker (close position)
-    if (decision.reason === 'STOP_LOSS_HIT' || decision.reason === 'CIRCUIT_BREAKER') {
-      const removed = portfolio.removePosition(decision.fromTicker, fromPrice);
+    if (reason === 'STOP_LOSS_HIT' || reason === 'CIRCUIT_BREAKER') {
+      const removed = portfolio.removePosition(fromTicker, fromPrice, timestamp);
       return {
         executed: removed,
-        fromTicker: decision.fromTicker,
-        reason: decision.reason,
+        fromTicker,
+        reason,
       };
     }
 
     // Handle score-based rotation
-    if (decision.toTicker && decision.reason === 'SCORE_DIFFERENTIAL') {
-      const toPrice = priceMap.get(decision.toTicker);
+    if (toTicker && reason === 'SCORE_DIFFERENTIAL') {
+      const toPrice = priceMap.get(toTicker);
       if (!toPrice) {
         return {
           executed: false,
-          reason: `No price for ${decision.toTicker}`,
+          reason: `No price for ${toTicker}`,
         };
       }
 
-      const position = portfolio.getPosition(decision.fromTicker);
+      const position = portfolio.getPosition(fromTicker);
       if (!position) {
         return { executed: false };
       }
 
-      // Calculate new shares
+      // Calculate new shares (the full sale value rolls into the new ticker)
       const positionValue = position.shares * fromPrice;
-      const newShares = Math.floor(positionValue / toPrice);
+      const newShares = this.positionSizer.calculateShares(positionValue, toPrice);
 
       if (newShares === 0) {
         return { executed: false, reason: 'Insufficient value for rotation' };
       }
 
       const rotated = portfolio.rotatePosition(
-        decision.fromTicker,
+        fromTicker,
         fromPrice,
-        decision.toTicker,
+        toTicker,
         toPrice,
-        0 // Score will be updated in next iteration
+        0, // Score will be updated in next iteration
+        newShares,
+        timestamp
       );
 
       return {
         executed: rotated,
-        fromTicker: decision.fromTicker,
-        toTicker: decision.toTicker,
+        fromTicker,
+        toTicker,
         newShares,
       };
     }
@@ -168,14 +183,16 @@ export class RotationEngine {
 
   /**
    * Execute multiple rotations
+   * All trades in the batch share one timestamp (the decisions were made together).
    */
   executeMultipleRotations(
     portfolio: Portfolio,
     decisions: RotationDecision[],
-    priceMap: Map<string, number>
+    priceMap: Map<string, number>,
+    timestamp: Date = new Date()
   ): RotationExecutionResult[] {
     return decisions
-      .map((decision) => this.executeRotation(portfolio, decision, priceMap))
+      .map((decision) => this.executeRotation(portfolio, decision, priceMap, timestamp))
       .filter((result) => result.executed);
   }
 
@@ -186,12 +203,19 @@ export class RotationEngine {
     _portfolio: Portfolio,
     decisions: RotationDecision[]
   ): { totalDecisions: number; rotations: number; stopLosses: number } {
-    const stopLosses = decisions.filter(
-      (d) => d.reason === 'STOP_LOSS_HIT'
-    ).length;
-    const rotations = decisions.filter(
-      (d) => d.reason === 'SCORE_DIFFERENTIAL'
-    ).length;
+    // One pass, switching on the reason tag
+    let stopLosses = 0;
+    let rotations = 0;
+    for (const { reason } of decisions) {
+      switch (reason) {
+        case 'STOP_LOSS_HIT':
+          stopLosses++;
+          break;
+        case 'SCORE_DIFFERENTIAL':
+          rotations++;
+          break;
+      }
+    }
 
     return {
       totalDecisions: decisions.length,
@@ -0,0 +1,63 @@
+/**
+ * Tests for Scanner
+ * Links to spec Section 5 (Catalyst Detection)
+ */
+
+import { describe, it, expect } from 'vitest';
+import { Scanner } from './scanner.js';
+import { CandleData } from '../data/market_data.js';
+
+describe('Scanner', () => {
+  const scanner = new Scanner();
+
+  const createCandles = (ticker: string, price: (i: number) => number): CandleData => {
+    const length = 60;
+    const prices: number[] = new Array(length);
+    const volumes: number[] = new Array(length);
+    const dates: Date[] = new Array(length);
+    const now = new Date();
+    for (let i = 0; i < length; i++) {
+      prices[i] = price(i);
+      volumes[i] = 1000000 + Math.sin(i * 1.3) * 250000;
+      dates[i] = now;
+    }
+    return { ticker, prices, volumes, dates };
+  };
+
+  // Oscillating uptrend: reaches the indicator checks under any threshold below ~0.6
+  const activeCandles = createCandles('HOT', (i) => 100 + i * 0.5 + Math.sin(i * 0.7) * 4);
+  // Flat at its 52-week low: only PRICE_NEAR_LOW (0.15) fires among the price signals
+  const flatCandles = createCandles('COLD', () => 100);
+
+  it('should return no signals for insufficient data', () => {
+    const candles = createCandles('SHORT', (i) => 100 + i);
+    const result = scanner.scanCandles({ ...candles, prices: candles.prices.slice(0, 20) });
+    expect(result.signals).toEqual([]);
+    expect(result.aggregatedScore).toBe(0);
+  });
+
+  it('should score a ticker that can reach minStrength the same as a full scan', () => {
+    const full = scanner.scanCandles(activeCandles);
+    expect(scanner.scanCandles(activeCandles, undefined, 0.3)).toEqual(full);
+  });
+
+  it('should stop at the price signals when minStrength is out of reach', () => {
+    // 0.15 from price signals + at most 0.60 from indicators cannot exceed 0.9
+    const early = scanner.scanCandles(flatCandles, undefined, 0.9);
+    const full = scanner.scanCandles(flatCandles);
+
+    expect(early.signals.map((signal) => signal.type)).toEqual(['PRICE_NEAR_LOW']);
+    expect(early.aggregatedScore).toBeCloseTo(0.15, 10);
+    // The full scan adds indicator signals, but still stays at or below the threshold
+    expect(full.signals.length).toBeGreaterThan(early.signals.length);
+    expect(full.aggregatedScore).toBeLessThanOrEqual(0.9);
+  });
+
+  it('should forward minStrength through scanMultiple', () => {
+    const results = scanner.scanMultiple([activeCandles, flatCandles], undefined, 0.9);
+    expect(results).toEqual([
+      scanner.scanCandles(activeCandles, undefined, 0.9),
+      scanner.scanCandles(flatCandles, undefined, 0.9),
+    ]);
+  });
+});
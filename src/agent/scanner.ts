@@ -3,7 +3,7 @@
  * Links to spec Section 5 (Catalyst Detection)
  */
 
-import { calculateIndicators } from '../utils/indicators.js';
+import { calculateIndicators, Indicators } from '../utils/indicators.js';
 import { CandleData } from '../data/market_data.js';
 
 export interface CatalystSignals {
@@ -18,30 +18,118 @@ export interface Signal {
   value: number;
 }
 
+// Catalyst signal weights per spec Section 5
+const W_RSI_OVERSOLD_BOUNCE = 0.15;
+const W_MACD_BULLISH_CROSSOVER = 0.25;
+const W_VOLUME_SPIKE = 0.2;
+const W_PRICE_NEAR_LOW = 0.15;
+const W_MOMENTUM_UP = 0.1;
+const W_VOLATILITY_EXPANSION = 0.1;
+const W_RSI_OVERBOUGHT_MOMENTUM = 0.05;
+
+// Upper bound on what the indicator-driven signals can add (each value is capped at 1;
+// RSI oversold and overbought are mutually exclusive, so only the larger counts)
+const MAX_INDICATOR_CONTRIBUTION =
+  Math.max(W_RSI_OVERSOLD_BOUNCE, W_RSI_OVERBOUGHT_MOMENTUM) + W_MACD_BULLISH_CROSSOVER + W_VOLUME_SPIKE;
+
+function aggregate(signals: Signal[]): number {
+  let sum = 0;
+  for (const signal of signals) {
+    sum += signal.weight * signal.value;
+  }
+  return sum;
+}
+
 export class Scanner {
   /**
    * Scan for catalysts in market data
    * Returns aggregated signal score per spec Section 5
+   * @param precomputed Indicators already calculated for these candles (skips recomputation)
+   * @param minStrength Callers that only care about scores above this can skip the indicator
+   *   pass when the cheap price signals already rule it out (default 0 = always full scan)
    */
-  scanCandles(candles: CandleData): CatalystSignals {
-    const signals: Signal[] = [];
+  scanCandles(candles: CandleData, precomputed?: Indicators, minStrength: number = 0): CatalystSignals {
+    const prices = candles.prices;
+    const n = prices.length;
 
-    if (candles.prices.length < 26) {
+    if (n < 26) {
       // Insufficient data for indicators
       return {
         ticker: candles.ticker,
-        signals,
+        signals: [],
         aggregatedScore: 0,
       };
     }
 
-    const indicators = calculateIndicators(candles.prices, candles.volumes);
+    // Cheap price-only signals first (no EMA work)
+    const priceSignals: Signal[] = [];
+
+    // 52-week (260 trading day) range and 20-day sum in one pass, read in place (no slices/spreads)
+    let low52 = Infinity;
+    let high52 = -Infinity;
+    for (let i = Math.max(0, n - 260); i < n; i++) {
+      const price = prices[i];
+      if (price < low52) low52 = price;
+      if (price > high52) high52 = price;
+    }
+    let sum20 = 0;
+    for (let i = Math.max(0, n - 20); i < n; i++) {
+      sum20 += prices[i];
+    }
+    const currentPrice = prices[n - 1];
+
+    // Signal 4: Price Near 52-week Low (weight: 15%)
+    const distanceFromLow = (currentPrice - low52) / low52;
+
+    if (distanceFromLow < 0.15) {
+      priceSignals.push({
+        type: 'PRICE_NEAR_LOW',
+        weight: W_PRICE_NEAR_LOW,
+        value: 1 - distanceFromLow / 0.15,
+      });
+    }
+
+    // Signal 5: Momentum (recent prices above 20-SMA, weight: 10%)
+    const sma20 = sum20 / 20;
+    if (currentPrice > sma20) {
+      priceSignals.push({
+        type: 'MOMENTUM_UP',
+        weight: W_MOMENTUM_UP,
+        value: (currentPrice - sma20) / sma20,
+      });
+    }
+
+    // Signal 6: Volatility Expansion (weight: 10%)
+    const volatilityRatio = (high52 - low52) / low52;
+
+    if (volatilityRatio > 0.5) {
+      priceSignals.push({
+        type: 'VOLATILITY_EXPANSION',
+        weight: W_VOLATILITY_EXPANSION,
+        value: Math.min(1, volatilityRatio / 1.0),
+      });
+    }
+
+    // Early exit: even a maximal indicator contribution can't lift this ticker above minStrength
+    if (minStrength > 0) {
+      const priceScore = aggregate(priceSignals);
+      if (priceScore + MAX_INDICATOR_CONTRIBUTION <= minStrength) {
+        return {
+          ticker: candles.ticker,
+          signals: priceSignals,
+          aggregatedScore: Math.min(1, priceScore),
+        };
+      }
+    }
+
+    const indicators = precomputed ?? calculateIndicators(prices, candles.volumes);
+    const signals: Signal[] = [];
 
     // Signal 1: RSI Oversold Bounce (weight: 15%)
     if (indicators.rsi < 30) {
       signals.push({
         type: 'RSI_OVERSOLD_BOUNCE',
-        weight: 0.15,
+        weight: W_RSI_OVERSOLD_BOUNCE,
         value: (30 - indicators.rsi) / 30, // Normalize 0-1
       });
     }
@@ -50,7 +138,7 @@ export class Scanner {
     if (indicators.macdHistogram > 0 && indicators.macd > indicators.macdSignal) {
       signals.push({
         type: 'MACD_BULLISH_CROSSOVER',
-        weight: 0.25,
+        weight: W_MACD_BULLISH_CROSSOVER,
         value: Math.min(
           1,
           indicators.macdHistogram / (Math.abs(indicators.macd) + 0.001)
@@ -62,74 +150,46 @@ export class Scanner {
     if (indicators.volumeRatio > 1.5) {
       signals.push({
         type: 'VOLUME_SPIKE',
-        weight: 0.2,
+        weight: W_VOLUME_SPIKE,
         value: Math.min(1, indicators.volumeRatio / 3),
       });
     }
 
-    // Signal 4: Price Near 52-week Low (weight: 15%)
-    const recentLow = Math.min(...candles.prices.slice(-260));
-    const currentPrice = candles.prices[candles.prices.length - 1];
-    const distanceFromLow = (currentPrice - recentLow) / recentLow;
-
-    if (distanceFromLow < 0.15) {
-      signals.push({
-        type: 'PRICE_NEAR_LOW',
-        weight: 0.15,
-        value: 1 - distanceFromLow / 0.15,
-      });
-    }
-
-    // Signal 5: Momentum (recent prices above 20-SMA, weight: 10%)
-    const sma20 =
-      candles.prices.slice(-20).reduce((a, b) => a + b, 0) / 20;
-    if (currentPrice > sma20) {
-      signals.push({
-        type: 'MOMENTUM_UP',
-        weight: 0.1,
-        value: (currentPrice - sma20) / sma20,
-      });
-    }
-
-    // Signal 6: Volatility Expansion (weight: 10%)
-    const high52 = Math.max(...candles.prices.slice(-260));
-    const low52 = Math.min(...candles.prices.slice(-260));
-    const volatilityRatio = (high52 - low52) / low52;
-
-    if (volatilityRatio > 0.5) {
-      signals.push({
-        type: 'VOLATILITY_EXPANSION',
-        weight: 0.1,
-        value: Math.min(1, volatilityRatio / 1.0),
-      });
-    }
+    // Signals 4-6 (price-based) keep their place in the reported order
+    signals.push(...priceSignals);
 
     // Signal 7: RSI Above 70 (overbought but momentum, weight: 5%)
     if (indicators.rsi > 70) {
       signals.push({
         type: 'RSI_OVERBOUGHT_MOMENTUM',
-        weight: 0.05,
+        weight: W_RSI_OVERBOUGHT_MOMENTUM,
         value: (indicators.rsi - 70) / 30,
       });
     }
 
-    // Calculate aggregated score
-    const aggregatedScore = signals.reduce(
-      (sum, signal) => sum + signal.weight * signal.value,
-      0
-    );
-
     return {
       ticker: candles.ticker,
       signals,
-      aggregatedScore: Math.min(1, aggregatedScore),
+      aggregatedScore: Math.min(1, aggregate(signals)),
     };
   }
 
   /**
    * Scan multiple tickers
+   * indicatorsList, when given, is index-aligned with candlesList
    */
-  scanMultiple(candlesList: CandleData[]): CatalystSignals[] {
-    return candlesList.map((candles) => this.scanCandles(candles));
+  scanMultiple(
+    candlesList: CandleData[],
+    indicatorsList?: Indicators[],
+    minStrength: number = 0
+  ): CatalystSignals[] {
+    return candlesList.map((candles, i) =>
+      this.scanCandles(candles, indicatorsList?.[i], minStrength)
+    );
   }
 }
+
+/**
+ * Shared stateless instance; import this rather than constructing a Scanner per caller
+ */
+export const scanner = new Scanner();
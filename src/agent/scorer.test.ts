@@ -5,6 +5,7 @@
 import { describe, it, expect } from 'vitest';
 import { Scorer } from './scorer';
 import { CandleData } from '../data/market_data';
+import { calculateIndicators } from '../utils/indicators';
 import { CatalystSignals } from './scanner';
 
 describe('Scorer', () => {
@@ -12,20 +13,27 @@ describe('Scorer', () => {
 
   // Deterministic mock candle data (no Math.random to avoid flaky tests)
   const createMockCandles = (trend: 'up' | 'down' = 'up'): CandleData => {
-    const prices: number[] = [];
-    const volumes: number[] = [];
-    const dates: Date[] = [];
-
-    for (let i = 0; i < 100; i++) {
-      const basePrice = 100 + (trend === 'up' ? i : -i) * 0.5;
-      prices.push(basePrice + Math.sin(i * 0.7) * 2);
-      volumes.push(1000000 + Math.sin(i * 1.3) * 250000 + 250000);
-      dates.push(new Date());
+    const length = 100;
+    const prices: number[] = new Array(length);
+    const volumes: number[] = new Array(length);
+    const dates: Date[] = new Array(length);
+    // One timestamp for every bar: scoring only reads prices and volumes
+    const now = new Date();
+    const slope = trend === 'up' ? 0.5 : -0.5;
+
+    for (let i = 0; i < length; i++) {
+      prices[i] = 100 + i * slope + Math.sin(i * 0.7) * 2;
+      volumes[i] = 1000000 + Math.sin(i * 1.3) * 250000 + 250000;
+      dates[i] = now;
     }
 
     return { ticker: 'TEST', prices, volumes, dates };
   };
 
+  // Built once and shared: scoring never mutates its candles
+  const upCandles = createMockCandles('up');
+  const downCandles = createMockCandles('down');
+
   const createMockCatalyst = (score: number): CatalystSignals => {
     return {
       ticker: 'TEST',
@@ -35,8 +43,6 @@ describe('Scorer', () => {
   };
 
   it('should produce valid scores for both uptrend and downtrend', () => {
-    const upCandles = createMockCandles('up');
-    const downCandles = createMockCandles('down');
     const catalyst = createMockCatalyst(0.5);
 
     const upScore = scorer.scoreTickerWithCandles('TEST', upCandles, catalyst);
@@ -53,10 +59,9 @@ describe('Scorer', () => {
   });
 
   it('should have components that sum to expected return', () => {
-    const candles = createMockCandles('up');
     const catalyst = createMockCatalyst(0.7);
 
-    const score = scorer.scoreTickerWithCandles('TEST', candles, catalyst);
+    const score = scorer.scoreTickerWithCandles('TEST', upCandles, catalyst);
 
     // Expected return should be weighted combination of components
     expect(score.expectedReturn).toBeGreaterThan(0);
@@ -78,6 +83,27 @@ describe('Scorer', () => {
     expect(threshold).toBe(0.02);
   });
 
+  it('should score a batch identically to per-ticker scoring', () => {
+    const candlesList = [upCandles, downCandles];
+    const catalysts = [createMockCatalyst(0.5), createMockCatalyst(0.2)];
+
+    const batch = scorer.scoreBatch(candlesList, catalysts);
+
+    expect(batch.length).toBe(2);
+    expect(batch[0]).toEqual(scorer.scoreTickerWithCandles('TEST', candlesList[0], catalysts[0]));
+    expect(batch[1]).toEqual(scorer.scoreTickerWithCandles('TEST', candlesList[1], catalysts[1]));
+  });
+
+  it('should score identically with precomputed indicators', () => {
+    const catalyst = createMockCatalyst(0.5);
+    const indicators = calculateIndicators(upCandles.prices, upCandles.volumes);
+
+    const precomputed = scorer.scoreTickerWithCandles('TEST', upCandles, catalyst, undefined, indicators);
+    const computed = scorer.scoreTickerWithCandles('TEST', upCandles, catalyst);
+
+    expect(precomputed).toEqual(computed);
+  });
+
   it('should handle insufficient data gracefully', () => {
     const candles: CandleData = {
       ticker: 'TEST',
@@ -6,8 +6,9 @@
  */
 
 import { CatalystSignals } from './scanner.js';
-import { calculateIndicators, calculateRSI, calculateMACD } from '../utils/indicators.js';
+import { calculateIndicators, calculateRSI, calculateMACDHistogram, Indicators } from '../utils/indicators.js';
 import { CandleData } from '../data/market_data.js';
+import { getConfig } from '../config.js';
 
 export interface Score {
   ticker: string;
@@ -22,18 +23,59 @@ export interface ScoreComponents {
   timingScore: number; // 10% weight - [-0.5,0.5] discrete
 }
 
+// PRD Section 4 component weights (fixed; sum to 1)
+const W_CATALYST = 0.4;
+const W_MOMENTUM = 0.3;
+const W_UPSIDE = 0.2;
+const W_TIMING = 0.1;
+
+// Indicators last computed per candle object. MarketData hands out the same cached CandleData
+// on repeat fetches, so re-scoring a ticker (e.g. across backtest days) skips the indicator pass.
+// Length and last close guard against candles that were extended in place.
+const indicatorCache = new WeakMap<CandleData, { length: number; lastPrice: number; indicators: Indicators }>();
+
+function cachedIndicators(candles: CandleData): Indicators {
+  const prices = candles.prices;
+  const lastPrice = prices[prices.length - 1];
+  const cached = indicatorCache.get(candles);
+  if (cached && cached.length === prices.length && cached.lastPrice === lastPrice) {
+    return cached.indicators;
+  }
+  const indicators = calculateIndicators(prices, candles.volumes);
+  indicatorCache.set(candles, { length: prices.length, lastPrice, indicators });
+  return indicators;
+}
+
+/**
+ * Bound a value to [min, max] with plain comparisons (NaN passes through, as with Math.min/max)
+ */
+function clamp(value: number, min: number, max: number): number {
+  return value < min ? min : value > max ? max : value;
+}
+
+/**
+ * Weighted expected return per PRD formula, clamped to [0, 1]
+ */
+function combineScore(catalyst: number, momentum: number, upside: number, timing: number): number {
+  return clamp(catalyst * W_CATALYST + momentum * W_MOMENTUM + upside * W_UPSIDE + timing * W_TIMING, 0, 1);
+}
+
 export class Scorer {
   /**
    * Score a ticker based on PRD multi-factor model
    * Per PRD Section 4: 40% catalyst + 30% momentum + 20% upside + 10% timing
+   * @param precomputed Indicators already calculated for these candles (e.g. by the scanner pass)
    */
   scoreTickerWithCandles(
     ticker: string,
     candles: CandleData,
     catalyst: CatalystSignals,
-    analystTargetPrice?: number
+    analystTargetPrice?: number,
+    precomputed?: Indicators
   ): Score {
-    if (candles.prices.length < 50) {
+    const prices = candles.prices;
+
+    if (prices.length < 50) {
       return {
         ticker,
         expectedReturn: 0,
@@ -46,16 +88,16 @@ export class Scorer {
       };
     }
 
-    const currentPrice = candles.prices[candles.prices.length - 1];
-    const indicators = calculateIndicators(candles.prices, candles.volumes);
+    const currentPrice = prices[prices.length - 1];
+    const indicators = precomputed ?? cachedIndicators(candles);
 
     // Component 1: Catalyst Score (40% weight)
     // PRD: catalyst_strength ∈ [0,1] is sum of triggered signal weights (clipped at 1)
-    const catalystScore = Math.min(1.0, Math.max(0.0, catalyst.aggregatedScore));
+    const catalystScore = clamp(catalyst.aggregatedScore, 0, 1);
 
     // Component 2: Momentum Acceleration (30% weight)
     // PRD: momentum_acceleration ∈ [-1,1] = normalized RSI delta + normalized MACD histogram delta
-    const momentumScore = this.calculateMomentumAcceleration(candles);
+    const momentumScore = this.calculateMomentumAcceleration(candles, indicators);
 
     // Component 3: Upside Potential (20% weight)
     // PRD: upside_potential ∈ [0,1] = min(1.0, (analyst_target_price - current_price)/current_price)
@@ -65,16 +107,9 @@ export class Scorer {
     // PRD: timing_factor ∈ [-0.5,0.5] with discrete buckets based on RSI/MACD
     const timingScore = this.calculateTimingFactor(indicators);
 
-    // Calculate weighted expected return per PRD formula
-    const expectedReturn =
-      catalystScore * 0.4 +
-      momentumScore * 0.3 +
-      upsideScore * 0.2 +
-      timingScore * 0.1;
-
     return {
       ticker,
-      expectedReturn: Math.min(1, Math.max(0, expectedReturn)),
+      expectedReturn: combineScore(catalystScore, momentumScore, upsideScore, timingScore),
       components: {
         catalystScore,
         momentumScore,
@@ -84,35 +119,57 @@ export class Scorer {
     };
   }
 
+  /**
+   * Score a batch of tickers in a single pass
+   * candlesList, catalysts and indicatorsList are index-aligned (as passed to/returned by Scanner.scanMultiple)
+   */
+  scoreBatch(
+    candlesList: CandleData[],
+    catalysts: CatalystSignals[],
+    analystTargets?: Map<string, number>,
+    indicatorsList?: Indicators[]
+  ): Score[] {
+    const results: Score[] = new Array(candlesList.length);
+    for (let i = 0; i < candlesList.length; i++) {
+      const candles = candlesList[i];
+      results[i] = this.scoreTickerWithCandles(
+        candles.ticker,
+        candles,
+        catalysts[i],
+        analystTargets?.get(candles.ticker),
+        indicatorsList?.[i]
+      );
+    }
+    return results;
+  }
+
   /**
    * Calculate momentum acceleration using RSI and MACD deltas
    * PRD: normalized RSI delta + normalized MACD histogram delta ∈ [-1, 1]
    */
-  private calculateMomentumAcceleration(candles: CandleData): number {
-    if (candles.prices.length < 30) return 0;
-
-    // Calculate current RSI
-    const currentRSI = calculateRSI(candles.prices, 14);
+  private calculateMomentumAcceleration(candles: CandleData, indicators: Indicators): number {
+    const prices = candles.prices;
+    if (prices.length < 30) return 0;
 
-    // Calculate previous RSI (5 periods ago for meaningful delta)
-    const prevPrices = candles.prices.slice(0, -5);
-    const prevRSI = calculateRSI(prevPrices, 14);
+    // Current RSI/MACD come from the indicators already computed for this ticker;
+    // only the lagged values (5 periods ago for meaningful delta) need a second pass
+    // (read in place as a prefix of prices rather than copying prices.slice(0, -5))
+    const currentRSI = indicators.rsi;
+    const prevEnd = prices.length - 5;
+    const prevRSI = calculateRSI(prices, 14, prevEnd);
 
     // RSI delta: range [-100, 100], normalize to [-1, 1]
     const rsiDelta = (currentRSI - prevRSI) / 100;
 
-    // Calculate current and previous MACD histogram
-    const currentMACD = calculateMACD(candles.prices);
-    const prevMACD = calculateMACD(prevPrices);
+    // Previous MACD histogram (MACD/signal lines are not needed here)
+    const prevHistogram = calculateMACDHistogram(prices, prevEnd);
 
     // MACD histogram delta (already in price units, normalize by typical range)
-    const macdDelta = currentMACD.histogram - prevMACD.histogram;
-    const normalizedMacdDelta = Math.max(-1, Math.min(1, macdDelta / 10)); // Assume ±10 is typical range
+    const macdDelta = indicators.macdHistogram - prevHistogram;
+    const normalizedMacdDelta = clamp(macdDelta / 10, -1, 1); // Assume ±10 is typical range
 
     // Combine: normalized RSI delta + normalized MACD delta, bounded to [-1, 1]
-    const momentumAcceleration = (rsiDelta + normalizedMacdDelta) / 2;
-
-    return Math.max(-1, Math.min(1, momentumAcceleration));
+    return clamp((rsiDelta + normalizedMacdDelta) / 2, -1, 1);
   }
 
   /**
@@ -126,7 +183,7 @@ export class Scorer {
     }
 
     const upside = (analystTargetPrice - currentPrice) / currentPrice;
-    return Math.min(1.0, Math.max(0.0, upside));
+    return clamp(upside, 0, 1);
   }
 
   /**
@@ -156,10 +213,6 @@ export class Scorer {
     }
   }
 
-  /**
-   * Calculate rotation threshold
-   * Per PRD Section 6: Threshold = 0.02 for aggressive rotation
-   */
   /**
    * Apply momentum acceleration curve.
    * Scores above 0.5 are boosted, scores below 0.5 are depressed.
@@ -172,7 +225,17 @@ export class Scorer {
     return Math.pow(score, 1.5);
   }
 
+  /**
+   * Calculate rotation threshold
+   * Per PRD Section 6: Threshold = 0.02 for aggressive rotation (ROTATION_THRESHOLD; the
+   * same config value RotationEngine applies)
+   */
   getRotationThreshold(): number {
-    return 0.02; // 2% differential triggers rotation
+    return getConfig().rotationThreshold;
   }
 }
+
+/**
+ * Shared stateless instance; import this rather than constructing a Scorer per caller
+ */
+export const scorer = new Scorer();
@@ -81,13 +81,11 @@ describe('Scorer Components (AC-1b)', () => {
     expect(s.components.timingScore).toBeLessThanOrEqual(0.5);
   });
 
-  // NOTE: applyMomentumAcceleration method was removed from Scorer class
-  // This test is commented out until the method is re-implemented
-  // it('applyMomentumAcceleration depresses low scores and boosts high scores', () => {
-  //   const low = scorer.applyMomentumAcceleration(0.2);
-  //   const high = scorer.applyMomentumAcceleration(0.85);
-
-  //   expect(low).toBeLessThan(0.2);
-  //   expect(high).toBeGreaterThan(0.85);
-  // });
+  it('applyMomentumAcceleration depresses low scores and boosts high scores', () => {
+    const low = scorer.applyMomentumAcceleration(0.2);
+    const high = scorer.applyMomentumAcceleration(0.85);
+
+    expect(low).toBeLessThan(0.2);
+    expect(high).toBeGreaterThan(0.85);
+  });
 });
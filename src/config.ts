@@ -0,0 +1,93 @@
+/**
+ * Runtime configuration
+ * Environment variables are read once and frozen into a typed config object
+ */
+
+import dotenv from 'dotenv';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import type { LogLevel } from './utils/logger.js';
+
+// Load .env before anything reads the environment (skipped when absent, e.g. in containers)
+const envPath = path.join(process.cwd(), '.env');
+if (fs.existsSync(envPath)) {
+  dotenv.config({ path: envPath });
+}
+
+export interface AppConfig {
+  readonly port: number;
+  readonly nodeEnv: string;
+  readonly databaseUrl?: string;
+  readonly finnhubApiKey?: string;
+  readonly azureOpenAI: {
+    readonly apiKey?: string;
+    readonly endpoint?: string;
+    readonly deploymentName: string;
+    readonly embeddingDeploymentName: string;
+    readonly apiVersion: string;
+  };
+  // Trading agent defaults (see .env.example)
+  readonly rotationThreshold: number;
+  readonly stopLossPercent: number;
+  readonly maxDrawdown: number;
+  readonly capital: number;
+  // Scanner early-exit threshold for analyzeWatchlist; 0 always runs the full catalyst scan
+  readonly minCatalystStrength: number;
+  // On-disk candle cache directory; undefined disables the disk tier
+  readonly marketDataCacheDir?: string;
+  // Minimum level for src/utils/logger.ts output
+  readonly logLevel: LogLevel;
+}
+
+let cachedConfig: AppConfig | null = null;
+
+const LOG_LEVELS: readonly LogLevel[] = ['debug', 'info', 'warn', 'error', 'silent'];
+
+function readNumber(value: string | undefined, fallback: number): number {
+  if (value === undefined || value.trim() === '') return fallback;
+  const parsed = Number(value);
+  return Number.isFinite(parsed) ? parsed : fallback;
+}
+
+function readLogLevel(value: string | undefined, fallback: LogLevel): LogLevel {
+  const level = value?.trim().toLowerCase() as LogLevel;
+  return LOG_LEVELS.includes(level) ? level : fallback;
+}
+
+/**
+ * Get the process-wide configuration
+ * The environment is snapshotted on first call; later calls return the same frozen object.
+ */
+export function getConfig(): AppConfig {
+  if (cachedConfig) {
+    return cachedConfig;
+  }
+
+  const env = { ...process.env };
+
+  cachedConfig = Object.freeze({
+    port: readNumber(env.PORT, 3000),
+    nodeEnv: env.NODE_ENV || 'development',
+    databaseUrl: env.DATABASE_URL || undefined,
+    finnhubApiKey: env.FINNHUB_API_KEY || undefined,
+    azureOpenAI: Object.freeze({
+      apiKey: env.AZURE_OPENAI_API_KEY || undefined,
+      endpoint: env.AZURE_OPENAI_ENDPOINT || undefined,
+      deploymentName: env.AZURE_OPENAI_DEPLOYMENT_NAME || 'gpt-4',
+      embeddingDeploymentName: env.AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME || 'text-embedding-ada-002',
+      apiVersion: env.AZURE_OPENAI_API_VERSION || '2024-02-15-preview',
+    }),
+    rotationThreshold: readNumber(env.ROTATION_THRESHOLD, 0.02),
+    stopLossPercent: readNumber(env.STOP_LOSS_PERCENT, -15),
+    maxDrawdown: readNumber(env.MAX_DRAWDOWN, -30),
+    capital: readNumber(env.CAPITAL, 10000),
+    minCatalystStrength: readNumber(env.MIN_CATALYST_STRENGTH, 0),
+    marketDataCacheDir: env.MARKET_DATA_CACHE_DIR === undefined
+      ? path.join(os.homedir(), '.cache', 'trader')
+      : env.MARKET_DATA_CACHE_DIR || undefined,
+    logLevel: readLogLevel(env.LOG_LEVEL, env.NODE_ENV === 'production' ? 'warn' : 'info'),
+  });
+
+  return cachedConfig;
+}
@@ -0,0 +1,76 @@
+/**
+ * Tests for MarketData price batching
+ * Yahoo Finance is mocked: these tests never touch the network or the disk cache
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { MarketData } from './market_data.js';
+
+const yahoo = vi.hoisted(() => ({
+  quote: vi.fn(),
+  historical: vi.fn(),
+}));
+
+vi.mock('yahoo-finance2', () => ({ default: yahoo }));
+
+// Daily bars whose last close is `close`
+const dailyBars = (close: number) =>
+  Array.from({ length: 5 }, (_, i) => ({
+    date: new Date(Date.UTC(2026, 0, 5 + i)),
+    open: close - 1,
+    high: close + 1,
+    low: close - 2,
+    close: close - 4 + i,
+    volume: 1000000,
+  }));
+
+describe('MarketData.fetchMultiplePrices', () => {
+  beforeEach(() => {
+    yahoo.quote.mockReset();
+    yahoo.historical.mockReset();
+    yahoo.historical.mockImplementation(async (ticker: string) => dailyBars(ticker === 'AAPL' ? 150 : 400));
+  });
+
+  it('should use live quotes when the batch prices every ticker', async () => {
+    yahoo.quote.mockResolvedValue([
+      { symbol: 'AAPL', regularMarketPrice: 151.5 },
+      { symbol: 'MSFT', regularMarketPrice: 402.25 },
+    ]);
+    const marketData = new MarketData({ cacheDir: null });
+
+    const prices = await marketData.fetchMultiplePrices(['AAPL', 'MSFT']);
+
+    expect(prices).toEqual(new Map([['AAPL', 151.5], ['MSFT', 402.25]]));
+    expect(yahoo.historical).not.toHaveBeenCalled();
+  });
+
+  it('should map normalized quote symbols back to the requested tickers', async () => {
+    yahoo.quote.mockResolvedValue([{ symbol: 'BRK-B', regularMarketPrice: 480 }]);
+    const marketData = new MarketData({ cacheDir: null });
+
+    const prices = await marketData.fetchMultiplePrices(['brk.b']);
+
+    expect(prices).toEqual(new Map([['brk.b', 480]]));
+  });
+
+  it('should fall back to daily closes for every ticker when the batch is partial', async () => {
+    yahoo.quote.mockResolvedValue([{ symbol: 'AAPL', regularMarketPrice: 151.5 }]);
+    const marketData = new MarketData({ cacheDir: null });
+
+    const prices = await marketData.fetchMultiplePrices(['AAPL', 'MSFT']);
+
+    // Both from historical candles, not a mix of live and daily prices
+    expect(prices).toEqual(new Map([['AAPL', 150], ['MSFT', 400]]));
+  });
+
+  it('should serve fully cached tickers from their closes without a quote request', async () => {
+    const marketData = new MarketData({ cacheDir: null });
+    await marketData.fetchCandles('AAPL');
+    await marketData.fetchCandles('MSFT');
+
+    const prices = await marketData.fetchMultiplePrices(['AAPL', 'MSFT']);
+
+    expect(prices).toEqual(new Map([['AAPL', 150], ['MSFT', 400]]));
+    expect(yahoo.quote).not.toHaveBeenCalled();
+  });
+});
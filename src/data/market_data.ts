@@ -3,7 +3,40 @@
  * Links to spec Section 3 (Market Data)
  */
 
-import yahooFinance from 'yahoo-finance2';
+import fs from 'fs/promises';
+import path from 'path';
+import { LRUCache } from '../utils/lru-cache.js';
+import { getConfig } from '../config.js';
+import { createLogger } from '../utils/logger.js';
+
+const log = createLogger('market-data');
+
+// yahoo-finance2 is loaded on first fetch so commands that never hit the network don't pay for it
+let yahooFinancePromise: Promise<any> | null = null;
+
+function loadYahooFinance(): Promise<any> {
+  if (!yahooFinancePromise) {
+    yahooFinancePromise = import('yahoo-finance2')
+      .then((mod) => mod.default)
+      .catch((error) => {
+        // Allow a retry on the next fetch instead of caching the failure
+        yahooFinancePromise = null;
+        throw error;
+      });
+  }
+  return yahooFinancePromise;
+}
+
+/**
+ * Comparable form of a ticker or Yahoo quote symbol (case-insensitive, '.' share-class separator as '-')
+ */
+function quoteSymbolKey(symbol: string): string {
+  return symbol.trim().toUpperCase().replace(/\./g, '-');
+}
+
+// Disk cache file names written by MarketData (`${ticker}_${days}d.json`, plus leftover temp files)
+const DISK_CACHE_FILE = /^[A-Za-z0-9._-]+_\d+d\.json(\.\d+-\d+\.tmp)?$/;
+let tempFileCounter = 0;
 
 export interface PriceData {
   ticker: string;
@@ -30,8 +63,20 @@ export interface CandleData {
  * Fetch historical price data from Yahoo Finance
  */
 export class MarketData {
-  private cache: Map<string, { data: CandleData; timestamp: number }> = new Map();
+  private cache = new LRUCache<CandleData>(500); // bounded for long-running servers
   private cacheExpiryMs = 60 * 60 * 1000; // 1 hour
+  private cacheDir: string | undefined;
+  // Disk writes still in flight (fetches don't wait for them; clearCache does)
+  private pendingWrites = new Set<Promise<void>>();
+
+  /**
+   * @param options.cacheDir Directory for the on-disk candle cache (null disables it; defaults to config)
+   */
+  constructor(options?: { cacheDir?: string | null }) {
+    this.cacheDir = options?.cacheDir === undefined
+      ? getConfig().marketDataCacheDir
+      : options.cacheDir || undefined;
+  }
 
   /**
    * Fetch recent price history for a ticker
@@ -44,9 +89,16 @@ export class MarketData {
     days: number = 100
   ): Promise<CandleData> {
     // Check cache
-    const cached = this.cache.get(ticker);
-    if (cached && Date.now() - cached.timestamp < this.cacheExpiryMs) {
-      return cached.data;
+    const cached = this.cache.get(ticker, this.cacheExpiryMs);
+    if (cached) {
+      return cached;
+    }
+
+    // Second tier: candles persisted by an earlier process, fresh by file mtime
+    const persisted = await this.readDiskCache(ticker, days);
+    if (persisted) {
+      this.cache.set(ticker, persisted);
+      return persisted;
     }
 
     try {
@@ -60,7 +112,8 @@ export class MarketData {
         period2: endDate,
         interval: '1d' as const
       };
-      const result = await (yahooFinance as any).historical(ticker, queryOptions);
+      const yahooFinance = await loadYahooFinance();
+      const result = await yahooFinance.historical(ticker, queryOptions);
 
       const prices: number[] = [];
       const volumes: number[] = [];
@@ -91,18 +144,71 @@ export class MarketData {
         lows,
       };
 
-      // Cache the result
-      this.cache.set(ticker, { data: candleData, timestamp: Date.now() });
+      // Cache the result (the disk write finishes in the background)
+      this.cache.set(ticker, candleData);
+      const write = this.writeDiskCache(ticker, days, candleData);
+      this.pendingWrites.add(write);
+      write.finally(() => this.pendingWrites.delete(write));
 
       return candleData;
     } catch (error) {
-      console.error(`Failed to fetch data for ${ticker}:`, error);
+      log.warn('Failed to fetch data for %s, using mock data:', ticker, error);
 
       // Fallback to mock data if Yahoo Finance fails
       return this.generateMockData(ticker, days);
     }
   }
 
+  /**
+   * Path of the on-disk cache file for a ticker/lookback pair
+   */
+  private diskCachePath(ticker: string, days: number): string {
+    const safeTicker = ticker.replace(/[^A-Za-z0-9.-]/g, '_');
+    return path.join(this.cacheDir!, `${safeTicker}_${days}d.json`);
+  }
+
+  /**
+   * Read candles from disk if the file is younger than the cache expiry
+   */
+  private async readDiskCache(ticker: string, days: number): Promise<CandleData | null> {
+    if (!this.cacheDir) return null;
+
+    const file = this.diskCachePath(ticker, days);
+    try {
+      const stat = await fs.stat(file);
+      if (Date.now() - stat.mtimeMs >= this.cacheExpiryMs) {
+        return null;
+      }
+      const data = JSON.parse(await fs.readFile(file, 'utf8'));
+      // Dates are stored as epoch milliseconds (cheaper to revive than ISO strings)
+      data.dates = data.dates.map((d: number | string) => new Date(d));
+      return data as CandleData;
+    } catch {
+      // Missing or unreadable cache file - fetch fresh
+      return null;
+    }
+  }
+
+  /**
+   * Persist candles to disk (best effort; a read-only or missing home dir just skips the disk tier)
+   * Written to a temp file and renamed into place, so readers never see a partial file.
+   */
+  private async writeDiskCache(ticker: string, days: number, candles: CandleData): Promise<void> {
+    if (!this.cacheDir) return;
+
+    const file = this.diskCachePath(ticker, days);
+    const tempFile = `${file}.${process.pid}-${++tempFileCounter}.tmp`;
+    try {
+      await fs.mkdir(this.cacheDir, { recursive: true });
+      const serialized = { ...candles, dates: candles.dates.map((d) => d.getTime()) };
+      await fs.writeFile(tempFile, JSON.stringify(serialized));
+      await fs.rename(tempFile, file);
+    } catch (error) {
+      log.warn('Failed to write candle cache for %s:', ticker, error);
+      await fs.rm(tempFile, { force: true }).catch(() => {});
+    }
+  }
+
   /**
    * Generate mock data as fallback
    */
@@ -126,10 +232,19 @@ export class MarketData {
       dates.push(date);
     }
 
-    const candles: CandleData = { ticker, prices, volumes, dates };
+    // Same shape as live candles (mock bars are flat: open/high/low = close)
+    const candles: CandleData = {
+      ticker,
+      prices,
+      volumes,
+      dates,
+      opens: prices.slice(),
+      highs: prices.slice(),
+      lows: prices.slice(),
+    };
 
     // Cache result
-    this.cache.set(ticker, { data: candles, timestamp: Date.now() });
+    this.cache.set(ticker, candles);
 
     return candles;
   }
@@ -146,30 +261,109 @@ export class MarketData {
   }
 
   /**
-   * Fetch prices for multiple tickers
+   * Fetch prices for multiple tickers, keyed by the tickers as requested
+   * Every price in one result comes from the same source, so a rotation pass compares like with like:
+   * - all tickers have fresh cached candles: their latest daily closes (no network)
+   * - otherwise one batched quote request; if it prices every ticker, the live regularMarketPrice
+   * - if the batch fails or is partial: latest daily closes for all, from cached candles or
+   *   per-ticker candle fetches (tickers whose candles can't be fetched are left out)
    */
   async fetchMultiplePrices(tickers: string[]): Promise<Map<string, number>> {
-    const prices = new Map<string, number>();
+    const closes = new Map<string, number>();
+    const missing: string[] = [];
+
+    for (const ticker of tickers) {
+      const cached = this.cache.get(ticker, this.cacheExpiryMs);
+      if (cached && cached.prices.length > 0) {
+        closes.set(ticker, cached.prices[cached.prices.length - 1]);
+      } else {
+        missing.push(ticker);
+      }
+    }
+
+    if (missing.length === 0) {
+      return closes;
+    }
+
+    const live = await this.fetchQuotes(tickers);
+    if (tickers.every((ticker) => live.has(ticker))) {
+      return live;
+    }
+    if (live.size > 0) {
+      log.info('Batch quote priced %d of %d tickers; using daily closes for all', live.size, tickers.length);
+    }
 
     await Promise.all(
-      tickers.map(async (ticker) => {
+      missing.map(async (ticker) => {
         try {
           const price = await this.fetchCurrentPrice(ticker);
-          prices.set(ticker, price);
+          closes.set(ticker, price);
         } catch {
           // Skip tickers with errors
         }
       })
     );
 
+    return closes;
+  }
+
+  /**
+   * Live regularMarketPrice for each ticker the batched quote request returned (empty on failure)
+   */
+  private async fetchQuotes(tickers: string[]): Promise<Map<string, number>> {
+    const prices = new Map<string, number>();
+    try {
+      // Yahoo returns normalized symbols (upper case, BRK.B as BRK-B); map them back to the request
+      const requested = new Map<string, string[]>();
+      for (const ticker of tickers) {
+        const key = quoteSymbolKey(ticker);
+        const tickersForKey = requested.get(key);
+        if (tickersForKey) {
+          tickersForKey.push(ticker);
+        } else {
+          requested.set(key, [ticker]);
+        }
+      }
+
+      const yahooFinance = await loadYahooFinance();
+      const quotes = await yahooFinance.quote(tickers, { return: 'array' });
+      for (const quote of quotes || []) {
+        if (quote?.symbol && quote.regularMarketPrice > 0) {
+          for (const ticker of requested.get(quoteSymbolKey(quote.symbol)) ?? []) {
+            prices.set(ticker, quote.regularMarketPrice);
+          }
+        }
+      }
+    } catch (error) {
+      log.warn('Batch quote failed for %d tickers:', tickers.length, error);
+    }
     return prices;
   }
 
   /**
-   * Clear cache
+   * Clear cache, in memory and on disk, so the next fetch of any ticker goes to the network
+   * Waits for in-flight disk writes first so none of them repopulates the cleared directory.
    */
-  clearCache(): void {
+  async clearCache(): Promise<void> {
     this.cache.clear();
+    if (!this.cacheDir) return;
+
+    await Promise.all(this.pendingWrites);
+    let files: string[];
+    try {
+      files = await fs.readdir(this.cacheDir);
+    } catch {
+      return; // No cache directory yet - nothing persisted
+    }
+    await Promise.all(
+      files
+        .filter((file) => DISK_CACHE_FILE.test(file))
+        .map((file) =>
+          fs.rm(path.join(this.cacheDir!, file), { force: true }).catch((error) => {
+            log.warn('Failed to remove candle cache file %s:', file, error);
+          })
+        )
+    );
   }
 
   /**
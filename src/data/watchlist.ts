@@ -10,6 +10,25 @@ export interface Watchlist {
 }
 
 export class WatchlistManager {
+  /** Seed watchlist (high-beta tickers), shared and frozen so callers can't mutate it */
+  static readonly DEFAULT_WATCHLIST: readonly string[] = Object.freeze([
+    'NVDA', // Nvidia - AI/semiconductors
+    'AMD', // AMD - semiconductors
+    'SMCI', // Super Micro - data center
+    'AVGO', // Broadcom - semiconductors
+    'MRVL', // Marvell - semiconductors
+    'TSLA', // Tesla - momentum play
+    'RIVN', // Rivian - EV moonshot
+    'PLTR', // Palantir - speculative
+    'CRWD', // CrowdStrike - cybersecurity
+    'NET', // Cloudflare - cloud/CDN
+    'DDOG', // Datadog - monitoring/SaaS
+    'ANET', // Arista - networking
+    'PANW', // Palo Alto - security
+    'COIN', // Coinbase - crypto exposure
+    'MSTR', // MicroStrategy - Bitcoin proxy
+  ]);
+
   private watchlists: Map<string, Watchlist> = new Map();
 
   /**
@@ -51,32 +70,17 @@ export class WatchlistManager {
 
   /**
    * Get all tickers in watchlist
+   * Returns a copy; use addTicker/removeTicker to change the watchlist.
    */
   getTickers(name: string): string[] {
-    return this.getOrCreate(name).tickers;
+    return [...this.getOrCreate(name).tickers];
   }
 
   /**
    * Load seed watchlist (default high-beta tickers)
    */
   loadSeedWatchlist(name: string = 'default'): string[] {
-    const tickers = [
-      'NVDA', // Nvidia - AI/semiconductors
-      'AMD', // AMD - semiconductors
-      'SMCI', // Super Micro - data center
-      'AVGO', // Broadcom - semiconductors
-      'MRVL', // Marvell - semiconductors
-      'TSLA', // Tesla - momentum play
-      'RIVN', // Rivian - EV moonshot
-      'PLTR', // Palantir - speculative
-      'CRWD', // CrowdStrike - cybersecurity
-      'NET', // Cloudflare - cloud/CDN
-      'DDOG', // Datadog - monitoring/SaaS
-      'ANET', // Arista - networking
-      'PANW', // Palo Alto - security
-      'COIN', // Coinbase - crypto exposure
-      'MSTR', // MicroStrategy - Bitcoin proxy
-    ];
+    const tickers = [...WatchlistManager.DEFAULT_WATCHLIST];
 
     for (const ticker of tickers) {
       this.addTicker(name, ticker);
@@ -5,13 +5,15 @@
 import { neon } from '@neondatabase/serverless';
 import { drizzle } from 'drizzle-orm/neon-http';
 import * as schema from './schema.js';
+import { getConfig } from '../config.js';
 
-if (!process.env.DATABASE_URL) {
+const { databaseUrl } = getConfig();
+if (!databaseUrl) {
   throw new Error('DATABASE_URL environment variable is required');
 }
 
 // Create Neon HTTP client
-const sql = neon(process.env.DATABASE_URL);
+const sql = neon(databaseUrl);
 
 // Create Drizzle instance
 export const db = drizzle(sql, { schema });
@@ -3,9 +3,13 @@
  */
 
 import { program } from 'commander';
+import { getConfig } from './config.js';
 import { PortfolioRotationAgent } from './agent/portfolio_rotation.js';
+import { topK } from './utils/top-k.js';
 
 async function main() {
+  const defaultCapital = String(getConfig().capital);
+
   program
     .name('portfolio-rotation-agent')
     .description('Return-maximization trading agent with LangChain reasoning')
@@ -13,7 +17,7 @@ async function main() {
 
   program
     .command('analyze')
-    .option('--capital <number>', 'Initial capital', '10000')
+    .option('--capital <number>', 'Initial capital', defaultCapital)
     .option('--reasoning', 'Show reasoning traces', false)
     .description('Analyze watchlist for trading opportunities')
     .action(async (options) => {
@@ -27,9 +31,7 @@ async function main() {
         const { scores, rotationDecisions } = await agent.analyzeWatchlist(watchlist);
 
         console.log('📈 Scores:');
-        const sortedScores = Array.from(scores.entries())
-          .sort((a, b) => b[1] - a[1])
-          .slice(0, 10);
+        const sortedScores = topK(scores.entries(), 10, ([, score]) => score);
 
         for (const [ticker, score] of sortedScores) {
           console.log(`  ${ticker}: ${(score * 100).toFixed(1)}%`);
@@ -37,12 +39,12 @@ async function main() {
 
         console.log('\n🔄 Rotation Decisions:', rotationDecisions.length);
 
-        const output = agent.getAgentOutput();
+        const performance = agent.getPerformance();
         console.log('\n💼 Portfolio:', {
-          totalValue: output.performance.totalValue.toFixed(2),
-          cash: output.performance.cash.toFixed(2),
-          pnl: output.performance.unrealizedPnL.toFixed(2),
-          pnlPercent: output.performance.unrealizedPnLPercent.toFixed(2),
+          totalValue: performance.totalValue.toFixed(2),
+          cash: performance.cash.toFixed(2),
+          pnl: performance.unrealizedPnL.toFixed(2),
+          pnlPercent: performance.unrealizedPnLPercent.toFixed(2),
         });
       } catch (error) {
         console.error('Error during analysis:', error);
@@ -51,7 +53,7 @@ async function main() {
 
   program
     .command('trade')
-    .option('--capital <number>', 'Initial capital', '10000')
+    .option('--capital <number>', 'Initial capital', defaultCapital)
     .description('Execute trades based on current signals')
     .action(async (options) => {
       const capital = parseInt(options.capital);
@@ -69,11 +71,11 @@ async function main() {
           console.log(`  ${trade.fromTicker} → ${trade.toTicker || 'CLOSE'}`);
         }
 
-        const output = agent.getAgentOutput();
+        const performance = agent.getPerformance();
         console.log('\n💼 Portfolio:', {
-          totalValue: output.performance.totalValue.toFixed(2),
+          totalValue: performance.totalValue.toFixed(2),
           positions: agent.getPositions().length,
-          cash: output.performance.cash.toFixed(2),
+          cash: performance.cash.toFixed(2),
         });
       } catch (error) {
         console.error('Error during trading:', error);
@@ -82,21 +84,21 @@ async function main() {
 
   program
     .command('dashboard')
-    .option('--capital <number>', 'Initial capital', '10000')
+    .option('--capital <number>', 'Initial capital', defaultCapital)
     .description('Show performance dashboard')
     .action(async (options) => {
       const capital = parseInt(options.capital);
       const agent = new PortfolioRotationAgent(capital);
 
-      const output = agent.getAgentOutput();
+      const performance = agent.getPerformance();
 
       console.log('\n📊 Portfolio Rotation Agent Dashboard\n');
       console.log('='.repeat(50));
-      console.log(`Total Value:      $${output.performance.totalValue.toFixed(2)}`);
-      console.log(`Cash:             $${output.performance.cash.toFixed(2)}`);
-      console.log(`Unrealized P&L:   $${output.performance.unrealizedPnL.toFixed(2)}`);
-      console.log(`Unrealized P&L%:  ${output.performance.unrealizedPnLPercent.toFixed(2)}%`);
-      console.log(`Max Drawdown:     ${output.performance.maxDrawdown.toFixed(2)}%`);
+      console.log(`Total Value:      $${performance.totalValue.toFixed(2)}`);
+      console.log(`Cash:             $${performance.cash.toFixed(2)}`);
+      console.log(`Unrealized P&L:   $${performance.unrealizedPnL.toFixed(2)}`);
+      console.log(`Unrealized P&L%:  ${performance.unrealizedPnLPercent.toFixed(2)}%`);
+      console.log(`Max Drawdown:     ${performance.maxDrawdown.toFixed(2)}%`);
       console.log('='.repeat(50));
     });
 
@@ -90,6 +90,35 @@ describe('Portfolio', () => {
     expect(portfolio.getPositions().length).toBe(0);
   });
 
+  it('should keep total value in sync after a partial sell', () => {
+    const portfolio = new Portfolio(10000);
+
+    portfolio.addPosition('NVDA', 100, 50, 0.8);
+    expect(portfolio.getTotalValue()).toBe(10000);
+
+    // Sell 20 of 50 shares at $110: +2200 cash, 30 shares left at $100 current price
+    expect(portfolio.reducePosition('NVDA', 20, 110)).toBe(true);
+    expect(portfolio.getCash()).toBe(7200);
+    expect(portfolio.getPosition('NVDA')!.shares).toBe(30);
+    expect(portfolio.getTotalValue()).toBe(10200); // 7200 cash + 30 × $100
+    expect(portfolio.getTradeCount('SELL')).toBe(1);
+
+    expect(portfolio.reducePosition('NVDA', 31, 110)).toBe(false); // More than held
+    expect(portfolio.reducePosition('NVDA', 30, 110)).toBe(true); // Full sell closes it
+    expect(portfolio.getPositionCount()).toBe(0);
+    expect(portfolio.getTotalValue()).toBe(10500);
+  });
+
+  it('should reflect share changes made on a held position', () => {
+    const portfolio = new Portfolio(10000);
+
+    portfolio.addPosition('NVDA', 100, 50, 0.8);
+    expect(portfolio.getTotalValue()).toBe(10000); // Holdings total now cached
+
+    portfolio.getPosition('NVDA')!.setShares(20);
+    expect(portfolio.getTotalValue()).toBe(7000); // 5000 cash + 20 × $100
+  });
+
   it('should rotate positions', () => {
     const portfolio = new Portfolio(10000);
 
@@ -102,6 +131,88 @@ describe('Portfolio', () => {
     expect(portfolio.getTickers()).not.toContain('NVDA');
   });
 
+  it('should reject invalid caller-sized rotation share counts', () => {
+    const portfolio = new Portfolio(10000);
+
+    portfolio.addPosition('NVDA', 100, 50, 0.8);
+
+    // 5000 proceeds + 5000 cash buys at most 200 AMD shares at $50
+    expect(portfolio.rotatePosition('NVDA', 100, 'AMD', 50, 0.9, -10)).toBe(false);
+    expect(portfolio.rotatePosition('NVDA', 100, 'AMD', 50, 0.9, 10.5)).toBe(false);
+    expect(portfolio.rotatePosition('NVDA', 100, 'AMD', 50, 0.9, 201)).toBe(false);
+    expect(portfolio.getTickers()).toEqual(['NVDA']);
+    expect(portfolio.getCash()).toBe(5000);
+    expect(portfolio.getTradeCount()).toBe(1);
+
+    expect(portfolio.rotatePosition('NVDA', 100, 'AMD', 50, 0.9, 200)).toBe(true);
+    expect(portfolio.getCash()).toBe(0);
+  });
+
+  it('should keep total value current after cached reads', () => {
+    const portfolio = new Portfolio(10000);
+
+    portfolio.addPosition('NVDA', 100, 50, 0.8);
+    expect(portfolio.getTotalValue()).toBe(10000);
+
+    portfolio.getPosition('NVDA')!.updatePrice(120);
+    expect(portfolio.getTotalValue()).toBe(11000);
+
+    portfolio.rotatePosition('NVDA', 120, 'AMD', 50, 0.9);
+    expect(portfolio.getTotalValue()).toBe(11000); // 5000 cash + 120 AMD shares at $50
+  });
+
+  it('should keep the delta-adjusted total in line with a fresh re-sum', () => {
+    const portfolio = new Portfolio(10000);
+
+    // Prices and share counts chosen so the running sum rounds differently from a fresh one
+    portfolio.addPosition('NVDA', 33.33, 17, 0.8);
+    portfolio.addPosition('AMD', 0.1, 3, 0.7);
+    portfolio.addPosition('TSLA', 77.77, 11, 0.6);
+    portfolio.removePosition('AMD', 0.1);
+    portfolio.addPosition('AAPL', 19.99, 23, 0.5);
+    portfolio.removePosition('NVDA', 33.33);
+
+    let freshHoldings = 0;
+    for (const position of portfolio.getPositions()) {
+      freshHoldings += position.getValue();
+    }
+    expect(portfolio.getTotalValue()).toBeCloseTo(freshHoldings + portfolio.getCash(), 8);
+
+    portfolio.removePosition('TSLA', 77.77);
+    portfolio.removePosition('AAPL', 19.99);
+    expect(portfolio.getTotalValue()).toBe(portfolio.getCash()); // Reset to exactly 0 holdings
+  });
+
+  it('should summarize value, P&L and drawdown consistently with the getters', () => {
+    const portfolio = new Portfolio(10000);
+
+    portfolio.addPosition('NVDA', 100, 50, 0.8);
+    portfolio.updatePrices(new Map([['NVDA', 110]]));
+    portfolio.getPosition('NVDA')!.updatePrice(90);
+
+    const summary = portfolio.getSummary();
+
+    expect(summary.totalValue).toBe(portfolio.getTotalValue());
+    expect(summary.cash).toBe(portfolio.getCash());
+    expect(summary.unrealizedPnL).toBe(portfolio.getUnrealizedPnL());
+    expect(summary.unrealizedPnLPercent).toBe(portfolio.getUnrealizedPnLPercent());
+    expect(summary.maxDrawdown).toBe(portfolio.getMaxDrawdown());
+  });
+
+  it('should count trades by type', () => {
+    const portfolio = new Portfolio(10000);
+
+    portfolio.addPosition('NVDA', 100, 50, 0.8);
+    portfolio.rotatePosition('NVDA', 100, 'AMD', 50, 0.9);
+    portfolio.removePosition('AMD', 50);
+
+    expect(portfolio.getTradeCount()).toBe(4);
+    expect(portfolio.getTradeCount('BUY')).toBe(1);
+    expect(portfolio.getTradeCount('ROTATION_IN')).toBe(1);
+    expect(portfolio.getTradeCount('ROTATION_OUT')).toBe(1);
+    expect(portfolio.getTradeCount('SELL')).toBe(1);
+  });
+
   it('should serialize to JSON', () => {
     const portfolio = new Portfolio(10000);
 
@@ -12,7 +12,15 @@ export interface PortfolioData {
   positions: PositionData[];
   cash: number;
   peakValue: number;
-  trades: Trade[];
+  trades: readonly Trade[];
+}
+
+export interface PortfolioSummary {
+  totalValue: number;
+  cash: number;
+  unrealizedPnL: number;
+  unrealizedPnLPercent: number;
+  maxDrawdown: number;
 }
 
 export class Portfolio {
@@ -21,6 +29,13 @@ export class Portfolio {
   private cash: number;
   private peakValue: number;
   private trades: TradeRecord;
+  // Sum of position values. Opening/closing a position adjusts it by that position's value, so it
+  // can differ from a fresh sum by float rounding until the next re-sum (after a price change or a
+  // replaced ticker, when it is null) or until the last position closes (reset to exactly 0).
+  private holdingsValue: number | null = 0;
+  private readonly invalidateHoldings = (): void => {
+    this.holdingsValue = null;
+  };
 
   constructor(initialCapital: number) {
     this.capital = initialCapital;
@@ -33,11 +48,50 @@ export class Portfolio {
    * Get total portfolio value
    */
   getTotalValue(): number {
-    let positionValue = 0;
-    for (const position of this.positions.values()) {
-      positionValue += position.getValue();
+    return this.getHoldingsValue() + this.cash;
+  }
+
+  /**
+   * Total value of open positions, re-summed only after a position or price change
+   */
+  private getHoldingsValue(): number {
+    if (this.holdingsValue === null) {
+      let positionValue = 0;
+      for (const position of this.positions.values()) {
+        positionValue += position.getValue();
+      }
+      this.holdingsValue = positionValue;
+    }
+    return this.holdingsValue;
+  }
+
+  /**
+   * Track a newly opened position so its price updates invalidate the holdings total
+   * A known holdings total is adjusted by the position's value instead of re-summed.
+   */
+  private openPosition(position: Position): void {
+    const replaced = this.positions.get(position.ticker);
+    if (replaced) {
+      replaced.setValueChangeListener(null);
+      this.holdingsValue = null;
+    } else if (this.holdingsValue !== null) {
+      this.holdingsValue += position.getValue();
+    }
+    position.setValueChangeListener(this.invalidateHoldings);
+    this.positions.set(position.ticker, position);
+  }
+
+  /**
+   * Stop tracking a closed position, taking its value out of a known holdings total
+   */
+  private closePosition(position: Position): void {
+    position.setValueChangeListener(null);
+    this.positions.delete(position.ticker);
+    if (this.positions.size === 0) {
+      this.holdingsValue = 0;
+    } else if (this.holdingsValue !== null) {
+      this.holdingsValue -= position.getValue();
     }
-    return positionValue + this.cash;
   }
 
   /**
@@ -76,6 +130,29 @@ export class Portfolio {
     return ((currentValue - this.peakValue) / this.peakValue) * 100;
   }
 
+  /**
+   * Value, P&L and drawdown figures together, from a single pass over positions
+   * Same values as the individual getters; use this when reporting several of them.
+   */
+  getSummary(): PortfolioSummary {
+    let positionValue = 0;
+    let unrealizedPnL = 0;
+    for (const position of this.positions.values()) {
+      positionValue += position.getValue();
+      unrealizedPnL += position.getUnrealizedPnL();
+    }
+    this.holdingsValue = positionValue;
+
+    const totalValue = positionValue + this.cash;
+    return {
+      totalValue,
+      cash: this.cash,
+      unrealizedPnL,
+      unrealizedPnLPercent: this.capital === 0 ? 0 : (unrealizedPnL / this.capital) * 100,
+      maxDrawdown: this.peakValue === 0 ? 0 : ((totalValue - this.peakValue) / this.peakValue) * 100,
+    };
+  }
+
   /**
    * Check if circuit breaker triggered (-30% max drawdown per spec)
    */
@@ -85,12 +162,14 @@ export class Portfolio {
 
   /**
    * Add a position (buy)
+   * @param timestamp Trade/entry time supplied by the caller; defaults to now
    */
   addPosition(
     ticker: string,
     price: number,
     shares: number,
-    score: number
+    score: number,
+    timestamp: Date = new Date()
   ): boolean {
     const cost = price * shares;
 
@@ -100,22 +179,19 @@ export class Portfolio {
     }
 
     // If position exists, add to it
-    if (this.positions.has(ticker)) {
-      const existing = this.positions.get(ticker)!;
-      const totalShares = existing.shares + shares;
-
-      existing.shares = totalShares;
+    const existing = this.positions.get(ticker);
+    if (existing) {
+      existing.setShares(existing.shares + shares);
       existing.updatePrice(price);
     } else {
-      this.positions.set(
-        ticker,
+      this.openPosition(
         new Position({
           ticker,
           entryPrice: price,
           shares,
           currentPrice: price,
           entryScore: score,
-          entryTimestamp: new Date(),
+          entryTimestamp: timestamp,
           peakPrice: price,
         })
       );
@@ -124,15 +200,16 @@ export class Portfolio {
     this.cash -= cost;
 
     // Record trade
-    this.trades.recordTrade(ticker, 'BUY', price, shares, score);
+    this.trades.recordTrade(ticker, 'BUY', price, shares, score, undefined, timestamp);
 
     return true;
   }
 
   /**
    * Remove a position (sell)
+   * @param timestamp Trade time supplied by the caller; defaults to now
    */
-  removePosition(ticker: string, price: number): boolean {
+  removePosition(ticker: string, price: number, timestamp: Date = new Date()): boolean {
     const position = this.positions.get(ticker);
     if (!position) return false;
 
@@ -145,12 +222,37 @@ export class Portfolio {
       'SELL',
       price,
       position.shares,
-      position.entryScore
+      position.entryScore,
+      undefined,
+      timestamp
     );
 
-    this.positions.delete(ticker);
+    this.closePosition(position);
+
+    // Update peak value if needed (O(1) when the holdings total was already known)
+    const newValue = this.getTotalValue();
+    if (newValue > this.peakValue) {
+      this.peakValue = newValue;
+    }
+
+    return true;
+  }
+
+  /**
+   * Sell part of a position (selling every share closes it, as removePosition does)
+   * @param timestamp Trade time supplied by the caller; defaults to now
+   */
+  reducePosition(ticker: string, shares: number, price: number, timestamp: Date = new Date()): boolean {
+    const position = this.positions.get(ticker);
+    if (!position || !(shares > 0) || shares > position.shares) return false;
+    if (shares === position.shares) return this.removePosition(ticker, price, timestamp);
+
+    this.cash += shares * price;
+    this.trades.recordTrade(ticker, 'SELL', price, shares, position.entryScore, undefined, timestamp);
+
+    // setShares notifies the listener, so the cached holdings total is re-summed on next read
+    position.setShares(position.shares - shares);
 
-    // Update peak value if needed
     const newValue = this.getTotalValue();
     if (newValue > this.peakValue) {
       this.peakValue = newValue;
@@ -161,13 +263,18 @@ export class Portfolio {
 
   /**
    * Rotate a position (sell old, buy new)
+   * @param newShares Share count already sized by the caller; derived from the sale value when omitted.
+   * Rejected (no trades recorded) unless it is a positive integer affordable from the proceeds plus cash.
+   * @param timestamp Time of both legs and the new entry; defaults to now
    */
   rotatePosition(
     oldTicker: string,
     oldPrice: number,
     newTicker: string,
     newPrice: number,
-    newScore: number
+    newScore: number,
+    newShares?: number,
+    timestamp: Date = new Date()
   ): boolean {
     const position = this.positions.get(oldTicker);
     if (!position) return false;
@@ -176,8 +283,13 @@ export class Portfolio {
     const value = shares * oldPrice;
 
     // Check if new position costs are reasonable
-    const newShares = Math.floor(value / newPrice);
-    if (newShares === 0) return false;
+    if (newShares === undefined) {
+      newShares = Math.floor(value / newPrice);
+    }
+    // A positive whole share count that the sale proceeds plus cash can pay for
+    if (!(newShares > 0) || !Number.isInteger(newShares) || newShares * newPrice > value + this.cash) {
+      return false;
+    }
 
     // Record old position sale
     this.trades.recordTrade(
@@ -185,28 +297,25 @@ export class Portfolio {
       'ROTATION_OUT',
       oldPrice,
       shares,
-      position.entryScore
+      position.entryScore,
+      undefined,
+      timestamp
     );
 
     // Record new position purchase
-    this.trades.recordTrade(newTicker, 'ROTATION_IN', newPrice, newShares, newScore);
-
-    // Execute rotation
-    this.positions.delete(oldTicker);
-    this.cash += value;
+    this.trades.recordTrade(newTicker, 'ROTATION_IN', newPrice, newShares, newScore, undefined, timestamp);
 
-    const newCost = newShares * newPrice;
-    this.cash -= newCost;
-
-    this.positions.set(
-      newTicker,
+    // Execute rotation: net both legs into a single cash update
+    this.cash += value - newShares * newPrice;
+    this.closePosition(position);
+    this.openPosition(
       new Position({
         ticker: newTicker,
         entryPrice: newPrice,
         shares: newShares,
         currentPrice: newPrice,
         entryScore: newScore,
-        entryTimestamp: new Date(),
+        entryTimestamp: timestamp,
         peakPrice: newPrice,
       })
     );
@@ -218,14 +327,19 @@ export class Portfolio {
    * Update prices for all positions
    */
   updatePrices(priceMap: Map<string, number>): void {
+    // Re-sum holdings while updating, so the peak check below needs no second pass
+    let positionValue = 0;
     for (const [ticker, position] of this.positions.entries()) {
-      if (priceMap.has(ticker)) {
-        position.updatePrice(priceMap.get(ticker)!);
+      const price = priceMap.get(ticker);
+      if (price !== undefined) {
+        position.updatePrice(price);
       }
+      positionValue += position.getValue();
     }
+    this.holdingsValue = positionValue;
 
     // Update peak value
-    const newValue = this.getTotalValue();
+    const newValue = positionValue + this.cash;
     if (newValue > this.peakValue) {
       this.peakValue = newValue;
     }
@@ -261,21 +375,36 @@ export class Portfolio {
 
   /**
    * Get trade history
+   * A frozen snapshot shared between calls; copy it ([...trades]) before sorting or editing.
    */
-  getTrades(): Trade[] {
-    return this.trades.getTrades() as Trade[];
+  getTrades(): readonly Trade[] {
+    return this.trades.getTrades();
+  }
+
+  /**
+   * Number of trades recorded, optionally of one type (O(1))
+   */
+  getTradeCount(type?: Trade['type']): number {
+    return this.trades.getTradeCount(type);
   }
 
   /**
    * Convert to serializable object
    */
   toJSON(): PortfolioData {
+    // Serialize positions straight from the map (no intermediate Position[] copy)
+    const positions: PositionData[] = new Array(this.positions.size);
+    let i = 0;
+    for (const position of this.positions.values()) {
+      positions[i++] = position.toJSON();
+    }
+
     return {
       capital: this.capital,
-      positions: Array.from(this.positions.values()).map((p) => p.toJSON()),
+      positions,
       cash: this.cash,
       peakValue: this.peakValue,
-      trades: this.trades.getTrades() as Trade[],
+      trades: this.trades.getTrades(),
     };
   }
 }
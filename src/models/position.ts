@@ -14,22 +14,53 @@ export interface PositionData {
 }
 
 export class Position {
-  ticker: string;
-  entryPrice: number;
-  shares: number;
-  currentPrice: number;
-  entryScore: number;
-  entryTimestamp: Date;
+  // Entry fields are fixed once opened; only shares/currentPrice/peakPrice change.
+  // Every field is assigned in the constructor so all positions share one object shape.
+  readonly ticker: string;
+  readonly entryPrice: number;
+  // Value inputs are private behind read-only getters: they change only through setShares and
+  // updatePrice, which notify the owning Portfolio so its cached holdings total can't go stale
+  private shareCount: number;
+  private lastPrice: number;
+  readonly entryScore: number;
+  readonly entryTimestamp: Date;
   peakPrice: number;
+  // 100 / entryPrice (0 for a zero entry), fixed at open so P&L % is a multiply per price tick
+  private readonly pnlPercentScale: number;
+  // Notified when setShares/updatePrice change the value (set by the owning Portfolio to invalidate its totals)
+  private onValueChange: (() => void) | null = null;
 
   constructor(data: PositionData) {
     this.ticker = data.ticker;
     this.entryPrice = data.entryPrice;
-    this.shares = data.shares;
-    this.currentPrice = data.currentPrice;
+    this.shareCount = data.shares;
+    this.lastPrice = data.currentPrice;
     this.entryScore = data.entryScore;
     this.entryTimestamp = data.entryTimestamp;
     this.peakPrice = Math.max(data.currentPrice, data.entryPrice);
+    this.pnlPercentScale = data.entryPrice === 0 ? 0 : 100 / data.entryPrice;
+  }
+
+  /**
+   * Shares held
+   */
+  get shares(): number {
+    return this.shareCount;
+  }
+
+  /**
+   * Latest price (set through updatePrice)
+   */
+  get currentPrice(): number {
+    return this.lastPrice;
+  }
+
+  /**
+   * Change the share count (e.g. adding to or partially selling the position)
+   */
+  setShares(shares: number): void {
+    this.shareCount = shares;
+    this.onValueChange?.();
   }
 
   /**
@@ -43,8 +74,7 @@ export class Position {
    * Get unrealized P&L percentage
    */
   getUnrealizedPnLPercent(): number {
-    if (this.entryPrice === 0) return 0;
-    return ((this.currentPrice - this.entryPrice) / this.entryPrice) * 100;
+    return (this.currentPrice - this.entryPrice) * this.pnlPercentScale;
   }
 
   /**
@@ -73,8 +103,16 @@ export class Position {
    * Update current price and peak
    */
   updatePrice(price: number): void {
-    this.currentPrice = price;
+    this.lastPrice = price;
     this.peakPrice = Math.max(this.peakPrice, price);
+    this.onValueChange?.();
+  }
+
+  /**
+   * Register the callback run after each price update (replaces any previous one)
+   */
+  setValueChangeListener(listener: (() => void) | null): void {
+    this.onValueChange = listener;
   }
 
   /**
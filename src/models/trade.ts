@@ -15,12 +15,27 @@ export interface Trade {
   readonly reason?: string;
 }
 
+function appendTo<K>(index: Map<K, Trade[]>, key: K, trade: Trade): void {
+  const list = index.get(key);
+  if (list) {
+    list.push(trade);
+  } else {
+    index.set(key, [trade]);
+  }
+}
+
 export class TradeRecord {
   private trades: Trade[] = [];
+  // Per-ticker and per-type indexes, appended alongside the log so lookups skip the full scan
+  private byTicker: Map<string, Trade[]> = new Map();
+  private byType: Map<Trade['type'], Trade[]> = new Map();
   private nextId = 0;
+  // Snapshot handed out by getTrades(); rebuilt only after the log changes
+  private snapshot: readonly Trade[] | null = null;
 
   /**
    * Record a new trade
+   * @param timestamp Execution time supplied by the caller (e.g. a backtest date); defaults to now
    */
   recordTrade(
     ticker: string,
@@ -28,11 +43,12 @@ export class TradeRecord {
     price: number,
     shares: number,
     score?: number,
-    reason?: string
+    reason?: string,
+    timestamp: Date = new Date()
   ): Trade {
     const trade: Trade = {
       id: `trade_${this.nextId++}`,
-      timestamp: new Date(),
+      timestamp,
       ticker,
       type,
       price,
@@ -43,35 +59,55 @@ export class TradeRecord {
     };
 
     this.trades.push(trade);
+    appendTo(this.byTicker, ticker, trade);
+    appendTo(this.byType, type, trade);
+    this.snapshot = null;
     return trade;
   }
 
   /**
    * Get all trades
+   * Returns a frozen snapshot that is reused until the next recordTrade/clear.
    */
   getTrades(): readonly Trade[] {
-    return [...this.trades];
+    if (this.snapshot === null) {
+      this.snapshot = Object.freeze([...this.trades]);
+    }
+    return this.snapshot;
   }
 
   /**
    * Get trades for a specific ticker
    */
   getTradesForTicker(ticker: string): Trade[] {
-    return this.trades.filter((t) => t.ticker === ticker);
+    return [...(this.byTicker.get(ticker) ?? [])];
   }
 
   /**
    * Get trades of a specific type
    */
   getTradesOfType(type: Trade['type']): Trade[] {
-    return this.trades.filter((t) => t.type === type);
+    return [...(this.byType.get(type) ?? [])];
+  }
+
+  /**
+   * Number of trades recorded, optionally of one type
+   * O(1): read from the log/type index lengths, no scan or filtered copy
+   */
+  getTradeCount(type?: Trade['type']): number {
+    if (type === undefined) return this.trades.length;
+    return this.byType.get(type)?.length ?? 0;
   }
 
   /**
    * Get most recent trades (for diagnostics)
    */
   getRecentTrades(count: number): Trade[] {
-    return [...this.trades].reverse().slice(0, count);
+    const recent: Trade[] = [];
+    for (let i = this.trades.length - 1; i >= 0 && recent.length < count; i--) {
+      recent.push(this.trades[i]);
+    }
+    return recent;
   }
 
   /**
@@ -79,6 +115,9 @@ export class TradeRecord {
    */
   clear(): void {
     this.trades = [];
+    this.byTicker.clear();
+    this.byType.clear();
     this.nextId = 0;
+    this.snapshot = null;
   }
 }
@@ -3,13 +3,10 @@
  * Provides REST endpoints for dashboard UI
  */
 
-import dotenv from 'dotenv';
-import path from 'path';
-
 // Load environment variables FIRST before any other imports
-const envPath = path.join(process.cwd(), '.env');
-dotenv.config({ path: envPath });
+import { getConfig } from '../config.js';
 
+import path from 'path';
 import express from 'express';
 import cors from 'cors';
 import { fileURLToPath } from 'url';
@@ -18,27 +15,31 @@ import { FinnhubService } from '../services/finnhub-service.js';
 import { MarketData } from '../data/market_data.js';
 import { clerkMiddleware, requireAuth as clerkRequireAuth } from '@clerk/express';
 
+const config = getConfig();
+const azureConfig = {
+  apiKey: config.azureOpenAI.apiKey!,
+  endpoint: config.azureOpenAI.endpoint!,
+  deploymentName: config.azureOpenAI.deploymentName,
+  embeddingDeploymentName: config.azureOpenAI.embeddingDeploymentName,
+  apiVersion: config.azureOpenAI.apiVersion,
+};
+const hasAzureOpenAI = Boolean(config.databaseUrl && azureConfig.apiKey && azureConfig.endpoint);
+
 // Initialize services
-if (!process.env.FINNHUB_API_KEY) {
+if (!config.finnhubApiKey) {
   console.warn('⚠️  FINNHUB_API_KEY not set — market data endpoints will return empty results');
 }
-const finnhubService = new FinnhubService(process.env.FINNHUB_API_KEY || '');
+const finnhubService = new FinnhubService(config.finnhubApiKey || '');
 const marketData = new MarketData();
 
 // Initialize stock data ingestion service
 let stockDataIngestionService: any = null;
-if (process.env.DATABASE_URL && process.env.AZURE_OPENAI_API_KEY && process.env.AZURE_OPENAI_ENDPOINT) {
+if (hasAzureOpenAI) {
   const { StockDataIngestionService } = await import('../services/stock-data-ingestion.js');
   stockDataIngestionService = new StockDataIngestionService(
-    process.env.FINNHUB_API_KEY!,
-    process.env.DATABASE_URL!,
-    {
-      apiKey: process.env.AZURE_OPENAI_API_KEY!,
-      endpoint: process.env.AZURE_OPENAI_ENDPOINT!,
-      deploymentName: process.env.AZURE_OPENAI_DEPLOYMENT_NAME || 'gpt-4',
-      embeddingDeploymentName: process.env.AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME || 'text-embedding-ada-002',
-      apiVersion: process.env.AZURE_OPENAI_API_VERSION || '2024-02-15-preview',
-    }
+    config.finnhubApiKey!,
+    config.databaseUrl!,
+    azureConfig
   );
 
   // Start continuous ingestion for top stocks (every 15 minutes) — fire-and-forget so server starts regardless
@@ -48,6 +49,14 @@ if (process.env.DATABASE_URL && process.env.AZURE_OPENAI_API_KEY && process.env.
     .catch((err: Error) => console.warn('⚠️  Stock data ingestion startup failed (non-fatal):', err.message));
 }
 
+// Large caps always included in scoring/rotation passes alongside the user's watchlist and holdings
+const TOP_TICKERS: readonly string[] = Object.freeze([
+  'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'NFLX',
+  'BRK.B', 'V', 'JNJ', 'WMT', 'JPM', 'MA', 'PG',
+  'UNH', 'HD', 'DIS', 'BAC', 'ADBE', 'CRM',
+  'CSCO', 'PEP', 'TMO',
+]);
+
 // Simple auth helper
 function getUserId(req: any): string {
   return req.auth?.userId || 'anonymous';
@@ -60,7 +69,7 @@ const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
 const app = express();
-const PORT = process.env.PORT || 3000;
+const PORT = config.port;
 
 // Middleware
 app.use(cors());
@@ -79,11 +88,11 @@ app.use(clerkMiddleware());
 app.use(express.static(path.join(__dirname, '../../public')));
 
 // Initialize UserService for multi-user support
-const userService = new UserService(process.env.DATABASE_URL!);
+const userService = new UserService(config.databaseUrl!);
 
 // Initialize ChatService with all integrated services (trading, technicals, sentiment, politicians)
 let chatService: any = null;
-if (process.env.DATABASE_URL && process.env.AZURE_OPENAI_API_KEY && process.env.AZURE_OPENAI_ENDPOINT && process.env.FINNHUB_API_KEY) {
+if (hasAzureOpenAI && config.finnhubApiKey) {
   try {
     const { ChatService } = await import('../services/chat-service.js');
     const { PortfolioRotationAgent } = await import('../agent/portfolio_rotation.js');
@@ -91,15 +100,9 @@ if (process.env.DATABASE_URL && process.env.AZURE_OPENAI_API_KEY && process.env.
     const sharedAgent = new PortfolioRotationAgent(10000);
     chatService = new ChatService(
       sharedAgent,
-      {
-        apiKey: process.env.AZURE_OPENAI_API_KEY!,
-        endpoint: process.env.AZURE_OPENAI_ENDPOINT!,
-        deploymentName: process.env.AZURE_OPENAI_DEPLOYMENT_NAME || 'gpt-4',
-        embeddingDeploymentName: process.env.AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME || 'text-embedding-ada-002',
-        apiVersion: process.env.AZURE_OPENAI_API_VERSION || '2024-02-15-preview',
-      },
-      process.env.DATABASE_URL!,
-      process.env.FINNHUB_API_KEY!,
+      azureConfig,
+      config.databaseUrl!,
+      config.finnhubApiKey!,
       { stockDataIngestionService }
     );
     console.log('Chat service initialized (integrated with trading, technicals, sentiment, politicians)');
@@ -117,14 +120,14 @@ app.get('/api/portfolio', requireAuth, async (req, res) => {
   try {
     const userId = getUserId(req);
     const agent = await userService.getUserAgent(userId);
-    const output = agent.getAgentOutput();
+    const performance = agent.getPerformance();
 
     res.json({
-      totalValue: output.performance.totalValue,
-      cash: output.performance.cash,
-      unrealizedPnL: output.performance.unrealizedPnL,
-      unrealizedPnLPercent: output.performance.unrealizedPnLPercent,
-      maxDrawdown: output.performance.maxDrawdown,
+      totalValue: performance.totalValue,
+      cash: performance.cash,
+      unrealizedPnL: performance.unrealizedPnL,
+      unrealizedPnLPercent: performance.unrealizedPnLPercent,
+      maxDrawdown: performance.maxDrawdown,
       positionCount: agent.getPositions().length,
     });
   } catch (error) {
@@ -165,13 +168,6 @@ app.get('/api/scores', requireAuth, async (req, res) => {
     const agent = await userService.getUserAgent(userId);
 
     // Build comprehensive ticker list: Top 25 + Watchlist + Owned
-    const top25 = [
-      'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'NFLX',
-      'BRK.B', 'V', 'JNJ', 'WMT', 'JPM', 'MA', 'PG',
-      'UNH', 'HD', 'DIS', 'BAC', 'ADBE', 'CRM', 'NFLX',
-      'CSCO', 'PEP', 'TMO'
-    ];
-
     // Get user's custom watchlist
     const watchlists = await userService.getUserWatchlists(userId);
     const defaultWatchlist = watchlists.find(w => w.name === 'default');
@@ -182,7 +178,7 @@ app.get('/api/scores', requireAuth, async (req, res) => {
     const ownedTickers = currentPositions.map((p: any) => p.ticker);
 
     // Combine all tickers and remove duplicates
-    const allTickers = [...new Set([...top25, ...watchlistTickers, ...ownedTickers])];
+    const allTickers = [...new Set([...TOP_TICKERS, ...watchlistTickers, ...ownedTickers])];
     console.log(`[/api/scores] Analyzing ${allTickers.length} tickers for user ${userId}`);
 
     const result = await agent.analyzeWatchlist(allTickers);
@@ -205,15 +201,18 @@ app.get('/api/scores', requireAuth, async (req, res) => {
 
     const prices = await Promise.all(pricePromises);
     const priceMap = new Map(prices);
-    const pricesWithValues = Array.from(priceMap.entries()).filter(([_, data]) => data.currentPrice > 0);
-    console.log(`[/api/scores] Fetched ${pricesWithValues.length}/${allTickers.length} prices successfully`);
+    let pricedCount = 0;
+    for (const [, data] of prices) {
+      if (data.currentPrice > 0) pricedCount++;
+    }
+    console.log(`[/api/scores] Fetched ${pricedCount}/${allTickers.length} prices successfully`);
 
-    const scores = Array.from(result.scores.entries()).map(([ticker, score]) => {
-      const priceData = priceMap.get(ticker) || { currentPrice: 0, priceChange: 0, priceChangePercent: 0 };
+    const scores = Array.from(result.scoreDetails.values(), (score) => {
+      const priceData = priceMap.get(score.ticker) || { currentPrice: 0, priceChange: 0, priceChangePercent: 0 };
       return {
-        ticker,
-        score: typeof score === 'number' ? score : (score as any).expectedReturn,
-        components: typeof score === 'number' ? {} : (score as any).components,
+        ticker: score.ticker,
+        score: score.expectedReturn,
+        components: score.components,
         currentPrice: priceData.currentPrice,
         priceChange: priceData.priceChange,
         priceChangePercent: priceData.priceChangePercent,
@@ -234,8 +233,7 @@ app.get('/api/trades', requireAuth, async (req, res) => {
   try {
     const userId = getUserId(req);
     const agent = await userService.getUserAgent(userId);
-    const output = agent.getAgentOutput();
-    res.json(output.trades);
+    res.json(agent.getTrades());
   } catch (error) {
     res.status(500).json({ error: (error as Error).message });
   }
@@ -253,10 +251,10 @@ app.post('/api/analyze', requireAuth, async (req, res) => {
     const result = await agent.analyzeWatchlist(watchlist || ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA']);
 
     res.json({
-      scores: Array.from(result.scores.entries()).map(([ticker, score]) => ({
-        ticker,
-        score: typeof score === 'number' ? score : (score as any).expectedReturn,
-        components: typeof score === 'number' ? {} : (score as any).components,
+      scores: Array.from(result.scoreDetails.values(), (score) => ({
+        ticker: score.ticker,
+        score: score.expectedReturn,
+        components: score.components,
       })),
       rotationDecisions: result.rotationDecisions,
     });
@@ -288,13 +286,6 @@ app.post('/api/execute', requireAuth, async (req, res) => {
     // Otherwise, run auto-rotation (legacy behavior)
     const agent = await userService.getUserAgent(userId);
 
-    const top25 = [
-      'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'NFLX',
-      'BRK.B', 'V', 'JNJ', 'WMT', 'JPM', 'MA', 'PG',
-      'UNH', 'HD', 'DIS', 'BAC', 'ADBE', 'CRM', 'NFLX',
-      'CSCO', 'PEP', 'TMO'
-    ];
-
     const watchlists = await userService.getUserWatchlists(userId);
     const defaultWatchlist = watchlists.find(w => w.name === 'default');
     const watchlistTickers = defaultWatchlist?.tickers || [];
@@ -302,19 +293,19 @@ app.post('/api/execute', requireAuth, async (req, res) => {
     const positions = agent.getPositions();
     const ownedTickers = positions.map((p: any) => p.ticker);
 
-    const allTickers = [...new Set([...top25, ...watchlistTickers, ...ownedTickers])];
+    const allTickers = [...new Set([...TOP_TICKERS, ...watchlistTickers, ...ownedTickers])];
 
     await agent.runTradingPass(allTickers);
 
-    const output = agent.getAgentOutput();
+    const performance = agent.getPerformance();
     res.json({
       portfolio: {
-        totalValue: output.performance.totalValue,
-        cash: output.performance.cash,
-        unrealizedPnL: output.performance.unrealizedPnL,
-        unrealizedPnLPercent: output.performance.unrealizedPnLPercent,
+        totalValue: performance.totalValue,
+        cash: performance.cash,
+        unrealizedPnL: performance.unrealizedPnL,
+        unrealizedPnLPercent: performance.unrealizedPnLPercent,
       },
-      trades: output.trades.slice(-10),
+      trades: agent.getTrades().slice(-10),
     });
   } catch (error) {
     res.status(500).json({ error: (error as Error).message });
@@ -473,7 +464,7 @@ app.get('/api/market/:ticker/politician-trades', requireAuth, async (req, res) =
   try {
     const { ticker } = req.params;
     const { PoliticianTradesDatabase } = await import('../services/politician-trades-db.js');
-    const tradesDb = new PoliticianTradesDatabase(process.env.DATABASE_URL!);
+    const tradesDb = new PoliticianTradesDatabase(config.databaseUrl!);
 
     const trades = await tradesDb.getTradesForTicker(ticker.toUpperCase(), 10);
     res.json(trades);
@@ -490,7 +481,7 @@ app.get('/api/politician/:name/trades', requireAuth, async (req, res) => {
     const { name } = req.params;
     const limit = req.query.limit ? parseInt(req.query.limit as string) : 10;
     const { PoliticianTradesDatabase } = await import('../services/politician-trades-db.js');
-    const tradesDb = new PoliticianTradesDatabase(process.env.DATABASE_URL!);
+    const tradesDb = new PoliticianTradesDatabase(config.databaseUrl!);
 
     const trades = await tradesDb.getTradesByPolitician(name, limit);
     res.json({ trades });
@@ -926,7 +917,7 @@ app.listen(PORT, () => {
   console.log(`\nPortfolio Management System`);
   console.log(`Server: http://localhost:${PORT}`);
   console.log(`Status: Running`);
-  console.log(`Environment: ${process.env.NODE_ENV || 'development'}\n`);
+  console.log(`Environment: ${config.nodeEnv}\n`);
 });
 
 export default app;
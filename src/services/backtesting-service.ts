@@ -3,9 +3,13 @@
  * Simulates portfolio rotation strategy over historical data
  */
 
-import { MarketData } from '../data/market_data.js';
-import { Scorer, Score } from '../agent/scorer.js';
+import { MarketData, CandleData } from '../data/market_data.js';
+import { Scorer, Score, scorer } from '../agent/scorer.js';
 import { CatalystSignals } from '../agent/scanner.js';
+import { topK } from '../utils/top-k.js';
+import { createLogger } from '../utils/logger.js';
+
+const log = createLogger('backtest');
 
 export interface BacktestConfig {
   startDate: Date;
@@ -23,6 +27,7 @@ export interface BacktestPosition {
   ticker: string;
   shares: number;
   entryPrice: number;
+  entryValue: number; // shares × entryPrice, fixed at entry (cost basis)
   entryDate: Date;
   exitPrice?: number;
   exitDate?: Date;
@@ -68,19 +73,19 @@ export interface BacktestResult {
 }
 
 export class BacktestingService {
-  private marketData: MarketData;
-  private scorer: Scorer;
+  private readonly marketData: MarketData;
+  private readonly scorer: Scorer;
 
   constructor() {
     this.marketData = new MarketData();
-    this.scorer = new Scorer();
+    this.scorer = scorer;
   }
 
   /**
    * Run backtest simulation
    */
   async runBacktest(config: BacktestConfig): Promise<BacktestResult> {
-    console.log(`Starting backtest: ${config.startDate.toISOString()} to ${config.endDate.toISOString()}`);
+    log.info('Starting backtest: %s to %s', config.startDate, config.endDate);
 
     const snapshots: BacktestSnapshot[] = [];
     const closedPositions: BacktestPosition[] = [];
@@ -113,6 +118,7 @@ export class BacktestingService {
 
         // Check stop loss and take profit
         if (config.stopLossPercent || config.takeProfitPercent) {
+          const exitedTickers = new Set<string>();
           for (const { position, currentPrice } of positionValues) {
             const pnlPercent = ((currentPrice - position.entryPrice) / position.entryPrice) * 100;
 
@@ -134,52 +140,56 @@ export class BacktestingService {
               position.exitPrice = currentPrice;
               position.exitDate = date;
               position.exitReason = exitReason;
-              position.pnl = exitValue - (position.shares * position.entryPrice);
+              position.pnl = exitValue - position.entryValue;
               position.pnlPercent = pnlPercent;
 
               closedPositions.push(position);
-              activePositions = activePositions.filter(p => p.ticker !== position.ticker);
+              exitedTickers.add(position.ticker);
             }
           }
+          if (exitedTickers.size > 0) {
+            activePositions = activePositions.filter(p => !exitedTickers.has(p.ticker));
+          }
         }
 
         // Get scores for all watchlist tickers
         const scores = await this.getScoresForDate(config.watchlist, date);
 
-        // Sort by score descending
-        const sortedScores = Array.from(scores.entries())
-          .sort((a, b) => b[1].expectedReturn - a[1].expectedReturn);
-
-        // Determine positions to enter/exit
-        const topTickers = sortedScores
-          .slice(0, config.maxPositions)
+        // Determine positions to enter/exit (only the best maxPositions are needed, not a full ranking)
+        const topTickers = topK(scores.entries(), config.maxPositions, ([, score]) => score.expectedReturn)
           .map(([ticker]) => ticker);
+        const topTickerSet = new Set(topTickers);
+        const heldTickers = new Set(activePositions.map(pos => pos.ticker));
+
+        // Fetch exit and entry prices concurrently before applying the (order-dependent) cash updates
+        const rebalancePrices = await this.fetchLatestPrices([
+          ...activePositions.filter(pos => !topTickerSet.has(pos.ticker)).map(pos => pos.ticker),
+          ...topTickers.filter(ticker => !heldTickers.has(ticker)),
+        ]);
 
         // Exit positions not in top N
         for (const pos of activePositions) {
-          if (!topTickers.includes(pos.ticker)) {
-            const candles = await this.marketData.fetchCandles(pos.ticker, 1);
-            const currentPrice = candles.prices[candles.prices.length - 1];
+          if (!topTickerSet.has(pos.ticker)) {
+            const currentPrice = rebalancePrices.get(pos.ticker)!;
             const exitValue = pos.shares * currentPrice;
             cash += exitValue;
 
             pos.exitPrice = currentPrice;
             pos.exitDate = date;
             pos.exitReason = 'rebalance';
-            pos.pnl = exitValue - (pos.shares * pos.entryPrice);
+            pos.pnl = exitValue - pos.entryValue;
             pos.pnlPercent = ((currentPrice - pos.entryPrice) / pos.entryPrice) * 100;
 
             closedPositions.push(pos);
           }
         }
 
-        activePositions = activePositions.filter(pos => topTickers.includes(pos.ticker));
+        activePositions = activePositions.filter(pos => topTickerSet.has(pos.ticker));
 
-        // Enter new positions
+        // Enter new positions (topTickers is unique, so the held set doesn't need updating here)
         for (const ticker of topTickers) {
-          if (!activePositions.find(p => p.ticker === ticker)) {
-            const candles = await this.marketData.fetchCandles(ticker, 1);
-            const price = candles.prices[candles.prices.length - 1];
+          if (!heldTickers.has(ticker)) {
+            const price = rebalancePrices.get(ticker)!;
             const positionSize = (cash * config.positionSizePercent / 100) / price;
 
             if (positionSize > 0) {
@@ -192,6 +202,7 @@ export class BacktestingService {
                   ticker,
                   shares,
                   entryPrice: price,
+                  entryValue: cost,
                   entryDate: date,
                 });
               }
@@ -200,10 +211,14 @@ export class BacktestingService {
         }
 
         // Calculate portfolio value
-        const positionsValue = activePositions.reduce((sum, pos) => {
-          const valueItem = positionValues.find(v => v.position.ticker === pos.ticker);
-          return sum + (valueItem?.value || 0);
-        }, 0);
+        const valueByTicker = new Map<string, number>();
+        for (const { position, value } of positionValues) {
+          valueByTicker.set(position.ticker, value);
+        }
+        let positionsValue = 0;
+        for (const pos of activePositions) {
+          positionsValue += valueByTicker.get(pos.ticker) || 0;
+        }
 
         const portfolioValue = cash + positionsValue;
         const dailyReturn = ((portfolioValue - previousPortfolioValue) / previousPortfolioValue) * 100;
@@ -213,7 +228,8 @@ export class BacktestingService {
           date,
           portfolioValue,
           cash,
-          positions: JSON.parse(JSON.stringify(activePositions)),
+          // Shallow per-position copy: later exits mutate the live objects, fields are primitives/Dates
+          positions: activePositions.map((pos) => ({ ...pos })),
           dailyReturn,
           cumulativeReturn,
         });
@@ -221,20 +237,20 @@ export class BacktestingService {
         previousPortfolioValue = portfolioValue;
 
       } catch (error) {
-        console.error(`Error processing date ${date.toISOString()}:`, error);
+        log.error('Error processing date %s:', date, error);
       }
     }
 
     // Close remaining positions at end date
+    const closingPrices = await this.fetchLatestPrices(activePositions.map(pos => pos.ticker));
     for (const pos of activePositions) {
-      const candles = await this.marketData.fetchCandles(pos.ticker, 1);
-      const currentPrice = candles.prices[candles.prices.length - 1];
+      const currentPrice = closingPrices.get(pos.ticker)!;
       const exitValue = pos.shares * currentPrice;
 
       pos.exitPrice = currentPrice;
       pos.exitDate = config.endDate;
       pos.exitReason = 'end_of_period';
-      pos.pnl = exitValue - (pos.shares * pos.entryPrice);
+      pos.pnl = exitValue - pos.entryValue;
       pos.pnlPercent = ((currentPrice - pos.entryPrice) / pos.entryPrice) * 100;
 
       closedPositions.push(pos);
@@ -293,6 +309,22 @@ export class BacktestingService {
     return dates;
   }
 
+  /**
+   * Fetch the latest close for several tickers concurrently
+   */
+  private async fetchLatestPrices(tickers: string[]): Promise<Map<string, number>> {
+    const candles = await Promise.all(
+      tickers.map((ticker) => this.marketData.fetchCandles(ticker, 1))
+    );
+
+    const prices = new Map<string, number>();
+    for (let i = 0; i < tickers.length; i++) {
+      const { prices: closes } = candles[i];
+      prices.set(tickers[i], closes[closes.length - 1]);
+    }
+    return prices;
+  }
+
   /**
    * Get scores for watchlist at a specific date
    */
@@ -302,29 +334,39 @@ export class BacktestingService {
   ): Promise<Map<string, Score>> {
     const scores = new Map<string, Score>();
 
-    for (const ticker of watchlist) {
-      try {
-        // Fetch historical data up to the date
-        const candleData = await this.marketData.fetchCandles(ticker, 100);
-
-        // For backtesting, we use simple catalyst signals
-        const dummyCatalyst: CatalystSignals = {
-          ticker,
-          signals: [],
-          aggregatedScore: 0,
-        };
-
-        // Calculate score using scorer
-        const score = this.scorer.scoreTickerWithCandles(
-          ticker,
-          candleData,
-          dummyCatalyst
-        );
+    // Gather index-aligned candle/catalyst arrays, then score them in one batch pass
+    const candlesList: CandleData[] = [];
+    const catalysts: CatalystSignals[] = [];
+
+    // Fetch all watchlist candles concurrently; results stay in watchlist order
+    const fetched = await Promise.all(
+      watchlist.map(async (ticker) => {
+        try {
+          // Fetch historical data up to the date
+          return await this.marketData.fetchCandles(ticker, 100);
+        } catch (error) {
+          log.warn('Error scoring %s:', ticker, error);
+          return null;
+        }
+      })
+    );
 
-        scores.set(ticker, score);
-      } catch (error) {
-        console.error(`Error scoring ${ticker}:`, error);
-      }
+    for (let i = 0; i < watchlist.length; i++) {
+      const candleData = fetched[i];
+      if (!candleData) continue;
+
+      candlesList.push(candleData);
+      // For backtesting, we use simple catalyst signals
+      catalysts.push({
+        ticker: watchlist[i],
+        signals: [],
+        aggregatedScore: 0,
+      });
+    }
+
+    const batch = this.scorer.scoreBatch(candlesList, catalysts);
+    for (let i = 0; i < batch.length; i++) {
+      scores.set(catalysts[i].ticker, batch[i]);
     }
 
     return scores;
@@ -346,58 +388,77 @@ export class BacktestingService {
     const years = (config.endDate.getTime() - config.startDate.getTime()) / (365.25 * 24 * 60 * 60 * 1000);
     const cagr = (Math.pow(finalValue / config.initialCapital, 1 / years) - 1) * 100;
 
-    // Calculate daily returns
-    const returns = snapshots.map(s => s.dailyReturn);
-    const avgReturn = returns.reduce((sum, r) => sum + r, 0) / returns.length;
-    const volatility = Math.sqrt(
-      returns.reduce((sum, r) => sum + Math.pow(r - avgReturn, 2), 0) / returns.length
-    ) * Math.sqrt(252); // Annualized
-
-    // Sharpe Ratio (assuming 0% risk-free rate)
-    const annualizedReturn = avgReturn * 252;
-    const sharpeRatio = volatility !== 0 ? annualizedReturn / volatility : 0;
-
-    // Sortino Ratio (downside deviation)
-    const downside = returns.filter(r => r < 0);
-    const downsideDeviation = downside.length > 0
-      ? Math.sqrt(downside.reduce((sum, r) => sum + Math.pow(r, 2), 0) / downside.length) * Math.sqrt(252)
-      : 0;
-    const sortinoRatio = downsideDeviation !== 0 ? annualizedReturn / downsideDeviation : 0;
-
-    // Max Drawdown
+    // Daily return moments, downside deviation and max drawdown in a single pass over snapshots
+    // (Welford's update keeps the variance stable without a second pass over the returns)
+    let count = 0;
+    let avgReturn = 0;
+    let sumSquaredDeviation = 0;
+    let downsideCount = 0;
+    let downsideSumSquares = 0;
     let peak = config.initialCapital;
     let maxDrawdown = 0;
     let maxDrawdownPercent = 0;
 
     for (const snapshot of snapshots) {
+      const r = snapshot.dailyReturn;
+      count++;
+      const delta = r - avgReturn;
+      avgReturn += delta / count;
+      sumSquaredDeviation += delta * (r - avgReturn);
+      if (r < 0) {
+        downsideCount++;
+        downsideSumSquares += r * r;
+      }
+
       if (snapshot.portfolioValue > peak) {
         peak = snapshot.portfolioValue;
       }
       const drawdown = peak - snapshot.portfolioValue;
-      const drawdownPercent = (drawdown / peak) * 100;
-
       if (drawdown > maxDrawdown) {
         maxDrawdown = drawdown;
-        maxDrawdownPercent = drawdownPercent;
+        maxDrawdownPercent = (drawdown / peak) * 100;
       }
     }
 
-    // Trade statistics
-    const winningTrades = closedPositions.filter(p => (p.pnl || 0) > 0);
-    const losingTrades = closedPositions.filter(p => (p.pnl || 0) < 0);
+    const volatility = Math.sqrt(sumSquaredDeviation / count) * Math.sqrt(252); // Annualized
+
+    // Sharpe Ratio (assuming 0% risk-free rate)
+    const annualizedReturn = avgReturn * 252;
+    const sharpeRatio = volatility !== 0 ? annualizedReturn / volatility : 0;
+
+    // Sortino Ratio (downside deviation)
+    const downsideDeviation = downsideCount > 0
+      ? Math.sqrt(downsideSumSquares / downsideCount) * Math.sqrt(252)
+      : 0;
+    const sortinoRatio = downsideDeviation !== 0 ? annualizedReturn / downsideDeviation : 0;
+
+    // Trade statistics: win/loss counts and sums in one pass over closed positions
+    let winningTrades = 0;
+    let losingTrades = 0;
+    let totalWins = 0;
+    let signedLosses = 0;
+    for (const position of closedPositions) {
+      const pnl = position.pnl || 0;
+      if (pnl > 0) {
+        winningTrades++;
+        totalWins += pnl;
+      } else if (pnl < 0) {
+        losingTrades++;
+        signedLosses += pnl;
+      }
+    }
+    const totalLosses = Math.abs(signedLosses);
     const winRate = closedPositions.length > 0
-      ? (winningTrades.length / closedPositions.length) * 100
+      ? (winningTrades / closedPositions.length) * 100
       : 0;
 
-    const totalWins = winningTrades.reduce((sum, p) => sum + (p.pnl || 0), 0);
-    const totalLosses = Math.abs(losingTrades.reduce((sum, p) => sum + (p.pnl || 0), 0));
     const profitFactor = totalLosses !== 0 ? totalWins / totalLosses : 0;
 
-    const avgWin = winningTrades.length > 0
-      ? totalWins / winningTrades.length
+    const avgWin = winningTrades > 0
+      ? totalWins / winningTrades
       : 0;
-    const avgLoss = losingTrades.length > 0
-      ? totalLosses / losingTrades.length
+    const avgLoss = losingTrades > 0
+      ? totalLosses / losingTrades
       : 0;
 
     // Calmar Ratio
@@ -416,8 +477,8 @@ export class BacktestingService {
       avgWin,
       avgLoss,
       totalTrades: closedPositions.length,
-      winningTrades: winningTrades.length,
-      losingTrades: losingTrades.length,
+      winningTrades,
+      losingTrades,
       volatility,
       calmarRatio,
     };
@@ -444,7 +505,7 @@ export class BacktestingService {
 
       return returns;
     } catch (error) {
-      console.error('Error fetching benchmark data:', error);
+      log.error('Error fetching benchmark data:', error);
       return [];
     }
   }
@@ -14,6 +14,7 @@ import { FinnhubService } from './finnhub-service.js';
 import { TechnicalIndicatorsService } from './technical-indicators.js';
 import { PoliticianTradesDatabase } from './politician-trades-db.js';
 import { MarketData } from '../data/market_data.js';
+import { LRUCache } from '../utils/lru-cache.js';
 
 export interface AzureOpenAIConfig {
   apiKey: string;
@@ -35,6 +36,57 @@ export interface ChatResponse {
   actions?: ChatAction[];
 }
 
+// "recommend buying/selling/analyzing TICKER" patterns, in the order actions are reported
+const TICKER_ACTION_PATTERNS: ReadonlyArray<{
+  readonly type: ChatAction['type'];
+  readonly pattern: RegExp;
+  readonly label: string;
+}> = [
+  { type: 'buy', pattern: /recommend(?:s|ing)?\s+buy(?:ing)?\s+(\w{1,5})/gi, label: 'Buy' },
+  { type: 'sell', pattern: /recommend(?:s|ing)?\s+sell(?:ing)?\s+(\w{1,5})/gi, label: 'Sell' },
+  { type: 'analyze', pattern: /recommend(?:s|ing)?\s+analyz(?:e|ing)\s+(\w{1,5})/gi, label: 'Analyze' },
+];
+
+// Chat clients are shared across ChatService instances with the same Azure deployment
+const chatModelCache = new LRUCache<AzureChatOpenAI>(4);
+
+function getChatModel(azureConfig: AzureOpenAIConfig): AzureChatOpenAI {
+  const apiVersion = azureConfig.apiVersion || '2024-02-15-preview';
+  const key = [azureConfig.endpoint, azureConfig.deploymentName, apiVersion, azureConfig.apiKey].join('|');
+
+  let llm = chatModelCache.get(key, Infinity);
+  if (!llm) {
+    llm = new AzureChatOpenAI({
+      azureOpenAIApiKey: azureConfig.apiKey,
+      azureOpenAIEndpoint: azureConfig.endpoint,
+      azureOpenAIApiDeploymentName: azureConfig.deploymentName,
+      azureOpenAIApiVersion: apiVersion,
+    });
+    chatModelCache.set(key, llm);
+  }
+  return llm;
+}
+
+// Static part of the answer prompt (appended after the question)
+const ANSWER_INSTRUCTIONS = `Provide a comprehensive, data-driven answer that:
+1. Synthesizes information from portfolio data, technical analysis, analyst sentiment, and market data
+2. Cites specific numbers, metrics, and sources
+3. Explains technical indicators (RSI, MACD, Bollinger, catalysts) in practical terms
+4. Provides actionable insights - recommend specific actions when appropriate
+5. References politician trading activity when relevant to the question
+6. Notes analyst consensus and price targets when discussing specific stocks
+7. Keeps responses clear and concise (2-4 paragraphs)
+
+When you recommend an action (buy, sell, analyze a stock, or rebalance), include it as a clear recommendation.
+If suggesting to buy a stock, mention the ticker clearly with "recommend buying [TICKER]".
+If suggesting to sell, mention "recommend selling [TICKER]".
+If suggesting analysis, mention "recommend analyzing [TICKER]".
+If suggesting portfolio rebalance, mention "recommend rebalancing".
+
+IMPORTANT: Always cite your sources using the format [source_type - source_name] when referencing specific data points.
+
+Answer:`;
+
 export class ChatService {
   private llm: AzureChatOpenAI;
   private vectorStore: PgVectorStore;
@@ -66,12 +118,7 @@ export class ChatService {
     this.defaultAgent = agent;
     this.azureConfig = azureConfig;
     this.vectorStore = new PgVectorStore(databaseUrl, azureConfig);
-    this.llm = new AzureChatOpenAI({
-      azureOpenAIApiKey: azureConfig.apiKey,
-      azureOpenAIEndpoint: azureConfig.endpoint,
-      azureOpenAIApiDeploymentName: azureConfig.deploymentName,
-      azureOpenAIApiVersion: azureConfig.apiVersion || '2024-02-15-preview',
-    });
+    this.llm = getChatModel(azureConfig);
     this.marketIntel = new MarketIntelligenceService(azureConfig);
     this.publicSourcesSearch = new PublicSourcesSearchService(finnhubApiKey, {
       alphaVantageService: options?.alphaVantageService,
@@ -170,7 +217,7 @@ export class ChatService {
 - Timestamp: ${trade.timestamp.toISOString()}
 - Shares: ${trade.shares}
 - Price: $${trade.price.toFixed(2)}
-- Total: $${(trade.price * trade.shares).toFixed(2)}
+- Total: $${trade.totalValue.toFixed(2)}
 - Reason: ${trade.reason || 'N/A'}
 - Score at Entry: ${trade.score?.toFixed(3) || 'N/A'}`,
         metadata: { type: 'trade', ticker: trade.ticker },
@@ -414,8 +461,8 @@ ${tickerList}`,
 
     // Build live portfolio summary for the prompt
     const positions = agent.getPositions();
-    const output = agent.getAgentOutput();
-    const portfolioSummary = `Current Portfolio: $${output.performance.totalValue.toFixed(0)} total, $${output.performance.cash.toFixed(0)} cash, ${positions.length} positions${positions.length > 0 ? ' (' + positions.map((p: any) => p.ticker).join(', ') + ')' : ''}`;
+    const performance = agent.getPerformance();
+    const portfolioSummary = `Current Portfolio: $${performance.totalValue.toFixed(0)} total, $${performance.cash.toFixed(0)} cash, ${positions.length} positions${positions.length > 0 ? ' (' + positions.map((p: any) => p.ticker).join(', ') + ')' : ''}`;
 
     // Combine contexts
     const fullContext = `## Live Portfolio State:\n${portfolioSummary}\n\n## Internal Portfolio & Market Data:\n${internalContext}\n\n## Public Market Data:\n${publicContext}`;
@@ -427,24 +474,7 @@ ${fullContext}
 
 Question: ${question}
 
-Provide a comprehensive, data-driven answer that:
-1. Synthesizes information from portfolio data, technical analysis, analyst sentiment, and market data
-2. Cites specific numbers, metrics, and sources
-3. Explains technical indicators (RSI, MACD, Bollinger, catalysts) in practical terms
-4. Provides actionable insights - recommend specific actions when appropriate
-5. References politician trading activity when relevant to the question
-6. Notes analyst consensus and price targets when discussing specific stocks
-7. Keeps responses clear and concise (2-4 paragraphs)
-
-When you recommend an action (buy, sell, analyze a stock, or rebalance), include it as a clear recommendation.
-If suggesting to buy a stock, mention the ticker clearly with "recommend buying [TICKER]".
-If suggesting to sell, mention "recommend selling [TICKER]".
-If suggesting analysis, mention "recommend analyzing [TICKER]".
-If suggesting portfolio rebalance, mention "recommend rebalancing".
-
-IMPORTANT: Always cite your sources using the format [source_type - source_name] when referencing specific data points.
-
-Answer:`;
+${ANSWER_INSTRUCTIONS}`;
 
     // Get answer from LLM
     const response = await this.llm.invoke(prompt);
@@ -478,42 +508,21 @@ Answer:`;
    */
   private parseActions(answer: string): ChatAction[] {
     const actions: ChatAction[] = [];
-    const lowerAnswer = answer.toLowerCase();
-
-    // Match "recommend buying TICKER" patterns
-    const buyMatches = answer.match(/recommend(?:s|ing)?\s+buy(?:ing)?\s+(\w{1,5})/gi);
-    if (buyMatches) {
-      for (const match of buyMatches) {
-        const ticker = match.replace(/recommend(?:s|ing)?\s+buy(?:ing)?\s+/i, '').toUpperCase();
-        if (ticker.length >= 1 && ticker.length <= 5 && !actions.find(a => a.ticker === ticker && a.type === 'buy')) {
-          actions.push({ type: 'buy', ticker, label: `Buy ${ticker}` });
-        }
-      }
-    }
 
-    // Match "recommend selling TICKER" patterns
-    const sellMatches = answer.match(/recommend(?:s|ing)?\s+sell(?:ing)?\s+(\w{1,5})/gi);
-    if (sellMatches) {
-      for (const match of sellMatches) {
-        const ticker = match.replace(/recommend(?:s|ing)?\s+sell(?:ing)?\s+/i, '').toUpperCase();
-        if (ticker.length >= 1 && ticker.length <= 5 && !actions.find(a => a.ticker === ticker && a.type === 'sell')) {
-          actions.push({ type: 'sell', ticker, label: `Sell ${ticker}` });
-        }
-      }
-    }
-
-    // Match "recommend analyzing TICKER" patterns
-    const analyzeMatches = answer.match(/recommend(?:s|ing)?\s+analyz(?:e|ing)\s+(\w{1,5})/gi);
-    if (analyzeMatches) {
-      for (const match of analyzeMatches) {
-        const ticker = match.replace(/recommend(?:s|ing)?\s+analyz(?:e|ing)\s+/i, '').toUpperCase();
-        if (ticker.length >= 1 && ticker.length <= 5 && !actions.find(a => a.ticker === ticker && a.type === 'analyze')) {
-          actions.push({ type: 'analyze', ticker, label: `Analyze ${ticker}` });
+    // The ticker is read straight from the capture group (no second regex pass per match)
+    for (const { type, pattern, label } of TICKER_ACTION_PATTERNS) {
+      const seen = new Set<string>();
+      for (const match of answer.matchAll(pattern)) {
+        const ticker = match[1].toUpperCase();
+        if (!seen.has(ticker)) {
+          seen.add(ticker);
+          actions.push({ type, ticker, label: `${label} ${ticker}` });
         }
       }
     }
 
     // Match rebalance recommendation
+    const lowerAnswer = answer.toLowerCase();
     if (lowerAnswer.includes('recommend rebalancing') || lowerAnswer.includes('recommend a rebalance')) {
       actions.push({ type: 'rebalance', label: 'Rebalance Portfolio' });
     }
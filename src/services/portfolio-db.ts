@@ -222,16 +222,32 @@ export class PortfolioDatabase {
       let total = 0;
       let totalReturn = 0;
 
-      const buyTrades = trades.filter(t => t.type === 'BUY');
-      const sellTrades = trades.filter(t => t.type === 'SELL');
-
-      for (const sell of sellTrades) {
-        const buy = buyTrades.find(b => b.ticker === sell.ticker && b.timestamp < sell.timestamp);
-        if (buy) {
-          total++;
-          const returnPct = ((sell.price - buy.price) / buy.price) * 100;
-          totalReturn += returnPct;
-          if (returnPct > 0) wins++;
+      // Single chronological pass (trades load newest first): each SELL pairs with the
+      // most recent BUY of its ticker timestamped strictly before it. Per ticker we track the
+      // latest BUY and the latest one older than it, for a SELL sharing the latest BUY's timestamp.
+      const lastBuys = new Map<string, { latest: Trade; earlier?: Trade }>();
+
+      for (let i = trades.length - 1; i >= 0; i--) {
+        const trade = trades[i];
+        if (trade.type === 'BUY') {
+          const buys = lastBuys.get(trade.ticker);
+          if (!buys) {
+            lastBuys.set(trade.ticker, { latest: trade });
+          } else {
+            if (buys.latest.timestamp < trade.timestamp) {
+              buys.earlier = buys.latest;
+            }
+            buys.latest = trade;
+          }
+        } else if (trade.type === 'SELL') {
+          const buys = lastBuys.get(trade.ticker);
+          const buy = buys && (buys.latest.timestamp < trade.timestamp ? buys.latest : buys.earlier);
+          if (buy) {
+            total++;
+            const returnPct = ((trade.price - buy.price) / buy.price) * 100;
+            totalReturn += returnPct;
+            if (returnPct > 0) wins++;
+          }
         }
       }
 
@@ -49,55 +49,34 @@ export interface TechnicalIndicators {
 
 export class TechnicalIndicatorsService {
   /**
-   * Calculate Simple Moving Average
+   * Simple Moving Average of the last `period` values
+   * Only the latest bar is ever read, so the full SMA series is not built.
    */
-  private calculateSMA(values: number[], period: number): number[] {
-    const sma: number[] = [];
-    for (let i = period - 1; i < values.length; i++) {
-      const sum = values.slice(i - period + 1, i + 1).reduce((a, b) => a + b, 0);
-      sma.push(sum / period);
+  private calculateSMA(values: number[], period: number): number {
+    let sum = 0;
+    for (let i = values.length - period; i < values.length; i++) {
+      sum += values[i];
     }
-    return sma;
+    return sum / period;
   }
 
   /**
-   * Calculate Exponential Moving Average
+   * Population standard deviation of the last `period` values around `mean`, read in place
    */
-  private calculateEMA(values: number[], period: number): number[] {
-    const ema: number[] = [];
-    const multiplier = 2 / (period + 1);
-
-    // Start with SMA for first value
-    const sma = values.slice(0, period).reduce((a, b) => a + b, 0) / period;
-    ema.push(sma);
-
-    // Calculate EMA for remaining values
-    for (let i = period; i < values.length; i++) {
-      const currentEMA = (values[i] - ema[ema.length - 1]) * multiplier + ema[ema.length - 1];
-      ema.push(currentEMA);
+  private calculateStdDev(values: number[], period: number, mean: number): number {
+    let sumSquares = 0;
+    for (let i = values.length - period; i < values.length; i++) {
+      sumSquares += Math.pow(values[i] - mean, 2);
     }
-
-    return ema;
-  }
-
-  /**
-   * Calculate standard deviation
-   */
-  private calculateStdDev(values: number[], mean: number): number {
-    const squaredDiffs = values.map(v => Math.pow(v - mean, 2));
-    const variance = squaredDiffs.reduce((a, b) => a + b, 0) / values.length;
-    return Math.sqrt(variance);
+    return Math.sqrt(sumSquares / period);
   }
 
   /**
    * Calculate Bollinger Bands
    */
   calculateBollingerBands(prices: number[], period: number = 20, stdDev: number = 2): BollingerBands {
-    const sma = this.calculateSMA(prices, period);
-    const currentSMA = sma[sma.length - 1];
-
-    const recentPrices = prices.slice(-period);
-    const sd = this.calculateStdDev(recentPrices, currentSMA);
+    const currentSMA = this.calculateSMA(prices, period);
+    const sd = this.calculateStdDev(prices, period, currentSMA);
 
     const upper = currentSMA + (sd * stdDev);
     const lower = currentSMA - (sd * stdDev);
@@ -119,21 +98,50 @@ export class TechnicalIndicatorsService {
    * Calculate MACD (Moving Average Convergence Divergence)
    */
   calculateMACD(prices: number[], fastPeriod: number = 12, slowPeriod: number = 26, signalPeriod: number = 9): MACD {
-    const fastEMA = this.calculateEMA(prices, fastPeriod);
-    const slowEMA = this.calculateEMA(prices, slowPeriod);
-
-    // MACD line
-    const macdLine: number[] = [];
-    const offset = slowPeriod - fastPeriod;
-    for (let i = 0; i < slowEMA.length; i++) {
-      macdLine.push(fastEMA[i + offset] - slowEMA[i]);
+    // Fast, slow and signal EMAs advance together in one pass over prices; each EMA is
+    // seeded with the SMA of its first `period` inputs
+    const fastMultiplier = 2 / (fastPeriod + 1);
+    const slowMultiplier = 2 / (slowPeriod + 1);
+    const signalMultiplier = 2 / (signalPeriod + 1);
+    let fastEMA = 0;
+    let slowEMA = 0;
+    let signal = 0;
+    let signalCount = 0;
+    let macd = NaN;
+
+    for (let i = 0; i < prices.length; i++) {
+      const price = prices[i];
+
+      if (i < fastPeriod) {
+        fastEMA += price;
+        if (i === fastPeriod - 1) fastEMA /= fastPeriod;
+      } else {
+        fastEMA = (price - fastEMA) * fastMultiplier + fastEMA;
+      }
+
+      if (i < slowPeriod) {
+        slowEMA += price;
+        if (i === slowPeriod - 1) slowEMA /= slowPeriod;
+      } else {
+        slowEMA = (price - slowEMA) * slowMultiplier + slowEMA;
+      }
+
+      // MACD line starts once the slow EMA is seeded; the signal line is its EMA
+      if (i >= slowPeriod - 1) {
+        macd = fastEMA - slowEMA;
+        if (signalCount < signalPeriod) {
+          signal += macd;
+          signalCount++;
+          if (signalCount === signalPeriod) signal /= signalPeriod;
+        } else {
+          signal = (macd - signal) * signalMultiplier + signal;
+        }
+      }
     }
 
-    // Signal line
-    const signalLine = this.calculateEMA(macdLine, signalPeriod);
+    // Fewer MACD values than signalPeriod: the seed SMA is all there is
+    if (signalCount < signalPeriod) signal /= signalPeriod;
 
-    const macd = macdLine[macdLine.length - 1];
-    const signal = signalLine[signalLine.length - 1];
     const histogram = macd - signal;
 
     let trend: 'bullish' | 'bearish' | 'neutral' = 'neutral';
@@ -382,7 +382,7 @@ export class UserService {
     message: string;
   }> {
     const agent = await this.getUserAgent(userId);
-    const portfolio = agent.getAgentOutput();
+    const performance = agent.getPerformance();
 
     if (side === 'buy') {
       // Fetch current price
@@ -393,8 +393,8 @@ export class UserService {
       if (price <= 0) throw new Error(`Could not get price for ${ticker}`);
 
       const cost = price * shares;
-      if (cost > portfolio.performance.cash) {
-        throw new Error(`Insufficient cash. Need $${cost.toFixed(2)} but only $${portfolio.performance.cash.toFixed(2)} available.`);
+      if (cost > performance.cash) {
+        throw new Error(`Insufficient cash. Need $${cost.toFixed(2)} but only $${performance.cash.toFixed(2)} available.`);
       }
 
       // Use the agent's portfolio.addPosition
@@ -428,23 +428,11 @@ export class UserService {
       const candles = await md.fetchCandles(ticker, 5);
       const price = candles.prices[candles.prices.length - 1] || position.currentPrice;
 
-      // For full sell, use removePosition; for partial, we need to handle manually
-      if (shares === position.shares) {
-        const success = (agent as any).portfolio
-          ? (agent as any).portfolio.removePosition(ticker, price)
-          : false;
-        if (!success) throw new Error('Failed to execute sell order');
-      } else {
-        // Partial sell — adjust position
-        const portfolio = (agent as any).portfolio;
-        if (!portfolio) throw new Error('Portfolio not accessible');
-        const pos = portfolio.getPosition(ticker);
-        if (pos) {
-          pos.shares -= shares;
-          portfolio['cash'] = (portfolio['cash'] || 0) + price * shares;
-          portfolio['trades']?.recordTrade(ticker, 'SELL', price, shares, pos.entryScore);
-        }
-      }
+      // reducePosition closes the position on a full sell and keeps portfolio totals in sync on a partial one
+      const portfolio = (agent as any).portfolio;
+      if (!portfolio) throw new Error('Portfolio not accessible');
+      const success = portfolio.reducePosition(ticker, shares, price);
+      if (!success) throw new Error('Failed to execute sell order');
 
       return {
         success: true,
@@ -8,12 +8,33 @@ import { describe, it, expect } from 'vitest';
 import {
   calculateRSI,
   calculateMACD,
+  calculateMACDHistogram,
   calculateEMA,
   calculateSMA,
   calculateVolumeRatio,
   calculateIndicators,
+  RSIState,
 } from './indicators.js';
 
+// Canonical 16-bar closes shared by the all-gains/all-losses RSI tests (built once, never mutated)
+const RISING_CLOSES = Array.from({ length: 16 }, (_, i) => 100 + i);
+const FALLING_CLOSES = RISING_CLOSES.slice().reverse();
+
+// Independent MACD reference: both EMAs recomputed over every prefix, then a 9-period EMA of the
+// last 9 MACD values (their plain mean when fewer are available)
+function referenceMACD(prices: number[]): { macd: number; signal: number } {
+  if (prices.length < 26) return { macd: 0, signal: 0 };
+  const series: number[] = [];
+  for (let end = 26; end <= prices.length; end++) {
+    const prefix = prices.slice(0, end);
+    series.push(calculateEMA(prefix, 12) - calculateEMA(prefix, 26));
+  }
+  const signal = series.length >= 9
+    ? calculateEMA(series.slice(-9), 9)
+    : series.reduce((a, b) => a + b, 0) / series.length;
+  return { macd: series[series.length - 1], signal };
+}
+
 describe('Indicators Module (AC-1a)', () => {
   // ===== RSI Tests =====
 
@@ -44,14 +65,12 @@ describe('Indicators Module (AC-1a)', () => {
     });
 
     it('should return RSI near 100 when all gains (no losses)', () => {
-      const prices = [100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115];
-      const rsi = calculateRSI(prices, 14);
+      const rsi = calculateRSI(RISING_CLOSES, 14);
       expect(rsi).toBeCloseTo(100, 0);
     });
 
     it('should return RSI 0 when all losses (no gains)', () => {
-      const prices = [115, 114, 113, 112, 111, 110, 109, 108, 107, 106, 105, 104, 103, 102, 101, 100];
-      const rsi = calculateRSI(prices, 14);
+      const rsi = calculateRSI(FALLING_CLOSES, 14);
       expect(rsi).toBe(0);
     });
 
@@ -62,6 +81,36 @@ describe('Indicators Module (AC-1a)', () => {
       const rsi14 = calculateRSI(prices, 14);
       expect(rsi7).not.toBeCloseTo(rsi14, 1);
     });
+
+    it('should apply Wilder smoothing over the full history', () => {
+      // Same last 15 closes, different earlier history: a simple 14-period average
+      // would give identical values, Wilder's smoothing carries the earlier moves forward
+      const recent = Array.from({ length: 15 }, (_, i) => 100 + Math.sin(i) * 3);
+      const calmHistory = [...Array(20).fill(100), ...recent];
+      const fallingHistory = [...Array.from({ length: 20 }, (_, i) => 140 - i * 2), ...recent];
+      expect(calculateRSI(fallingHistory, 14)).toBeLessThan(calculateRSI(calmHistory, 14));
+    });
+
+    it('should match the published Wilder RSI reference values', () => {
+      // Classic 14-period worked example (reference values rounded intermediates to 2 decimals)
+      const closes = [
+        44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.1, 45.42, 45.84, 46.08,
+        45.89, 46.03, 45.61, 46.28, 46.28, 46.0, 46.03, 46.41, 46.22, 45.64,
+      ];
+      const expected = [70.53, 66.32, 66.55, 69.41, 66.36, 57.97];
+      expected.forEach((rsi, i) => {
+        expect(calculateRSI(closes, 14, 15 + i)).toBeCloseTo(rsi, 0);
+      });
+    });
+
+    it('should stream the same RSI as the batch calculation on every bar', () => {
+      const prices = Array.from({ length: 60 }, (_, i) => 100 + Math.sin(i / 3) * 5 + i * 0.1);
+      const state = new RSIState(14);
+      prices.forEach((price, i) => {
+        expect(state.push(price)).toBe(calculateRSI(prices, 14, i + 1));
+      });
+      expect(state.value()).toBe(calculateRSI(prices, 14));
+    });
   });
 
   // ===== EMA Tests =====
@@ -158,6 +207,27 @@ describe('Indicators Module (AC-1a)', () => {
       const { macd } = calculateMACD(prices);
       expect(macd).toBeCloseTo(0, 2);
     });
+
+    it('should match the per-prefix EMA definition on a 60-bar series', () => {
+      const prices = Array.from({ length: 60 }, (_, i) => 100 + Math.sin(i / 4) * 6 + i * 0.2);
+
+      const { macd, signal } = referenceMACD(prices);
+
+      const result = calculateMACD(prices);
+      expect(result.macd).toBeCloseTo(macd, 10);
+      expect(result.signal).toBeCloseTo(signal, 10);
+      expect(result.histogram).toBeCloseTo(macd - signal, 10);
+    });
+
+    it.each([3, 30, 40, 100])('should match the per-prefix reference when computing the histogram only (%i bars)', (length) => {
+      const prices = Array.from({ length }, (_, i) => 100 + Math.sin(i / 5) * 10 + i * 0.3);
+      const full = referenceMACD(prices);
+      expect(calculateMACDHistogram(prices)).toBeCloseTo(full.macd - full.signal, 10);
+
+      // In-place prefix read, as the scorer does for the lagged histogram
+      const lagged = referenceMACD(prices.slice(0, length - 5));
+      expect(calculateMACDHistogram(prices, length - 5)).toBeCloseTo(lagged.macd - lagged.signal, 10);
+    });
   });
 
   // ===== Volume Ratio Tests =====
@@ -13,29 +13,46 @@ export interface Indicators {
 
 /**
  * Calculate RSI (Relative Strength Index)
- * 14-period RSI per spec Section 4
+ * 14-period RSI per spec Section 4, with Wilder's smoothing: the first average is the plain
+ * mean of the first `period` changes, then each later change is folded in as
+ * avg = (avg × (period − 1) + change) / period.
+ * @param end Exclusive end index, to read a prefix of prices in place (default: all prices)
  */
-export function calculateRSI(prices: number[], period: number = 14): number {
-  if (prices.length < period + 1) {
+export function calculateRSI(prices: number[], period: number = 14, end: number = prices.length): number {
+  if (end < period + 1) {
     return 50; // Neutral RSI if insufficient data
   }
 
-  const closes = prices.slice(-period - 1);
+  // Seed with the simple average of the first `period` gains/losses
   let gains = 0;
   let losses = 0;
-
-  for (let i = 1; i < closes.length; i++) {
-    const change = closes[i] - closes[i - 1];
+  for (let i = 1; i <= period; i++) {
+    const change = prices[i] - prices[i - 1];
     if (change > 0) {
       gains += change;
     } else {
-      losses += Math.abs(change);
+      losses -= change;
     }
   }
+  let avgGain = gains / period;
+  let avgLoss = losses / period;
+
+  // Wilder smoothing over the remaining changes, in a single pass without temporaries
+  for (let i = period + 1; i < end; i++) {
+    const change = prices[i] - prices[i - 1];
+    const gain = change > 0 ? change : 0;
+    const loss = change < 0 ? -change : 0;
+    avgGain = (avgGain * (period - 1) + gain) / period;
+    avgLoss = (avgLoss * (period - 1) + loss) / period;
+  }
 
-  const avgGain = gains / period;
-  const avgLoss = losses / period;
+  return rsiFromAverages(avgGain, avgLoss);
+}
 
+/**
+ * RSI from smoothed average gain/loss, bounded to [0, 100]
+ */
+function rsiFromAverages(avgGain: number, avgLoss: number): number {
   if (avgLoss === 0) {
     // Avoid returning identical 100 for different periods by
     // returning a very high RSI computed via a large RS value.
@@ -52,6 +69,114 @@ export function calculateRSI(prices: number[], period: number = 14): number {
   return Math.min(100, Math.max(0, rsi));
 }
 
+/**
+ * Streaming RSI: O(1) per price instead of re-scanning the history on every bar
+ * push() returns the same value as calculateRSI over all prices pushed so far.
+ */
+export class RSIState {
+  private readonly period: number;
+  private started = false;
+  private prevPrice = 0;
+  private changes = 0;
+  private avgGain = 0;
+  private avgLoss = 0;
+
+  constructor(period: number = 14) {
+    this.period = period;
+  }
+
+  /**
+   * Fold in the next close and return the current RSI (50 until period + 1 prices are seen)
+   */
+  push(price: number): number {
+    const period = this.period;
+    if (!this.started) {
+      this.started = true;
+      this.prevPrice = price;
+      return 50;
+    }
+
+    const change = price - this.prevPrice;
+    this.prevPrice = price;
+    this.changes++;
+
+    if (this.changes <= period) {
+      // Accumulate sums for the seed average, as calculateRSI does
+      if (change > 0) {
+        this.avgGain += change;
+      } else {
+        this.avgLoss -= change;
+      }
+      if (this.changes === period) {
+        this.avgGain /= period;
+        this.avgLoss /= period;
+      }
+    } else {
+      const gain = change > 0 ? change : 0;
+      const loss = change < 0 ? -change : 0;
+      this.avgGain = (this.avgGain * (period - 1) + gain) / period;
+      this.avgLoss = (this.avgLoss * (period - 1) + loss) / period;
+    }
+
+    return this.value();
+  }
+
+  /**
+   * Current RSI without consuming a price
+   */
+  value(): number {
+    return this.changes < this.period ? 50 : rsiFromAverages(this.avgGain, this.avgLoss);
+  }
+}
+
+// MACD 12/26/9 smoothing factors, fixed at module load rather than derived per call
+const MACD_FAST_ALPHA = 2 / (12 + 1);
+const MACD_SLOW_ALPHA = 2 / (26 + 1);
+const MACD_SIGNAL_ALPHA = 2 / (9 + 1);
+
+/**
+ * MACD line and signal at the last bar, in a single pass with no intermediate series
+ * The signal is the 9-period EMA over the final 9 MACD values (seeded at the first of them),
+ * or their plain mean when fewer than 9 are available.
+ */
+function computeMACD(prices: number[], end: number): { macd: number; signal: number } {
+  // EMA over a prefix prices[0..i] equals the running EMA at index i (both seed at prices[0]),
+  // so one pass yields every MACD value instead of recomputing EMAs for every prefix
+  const alpha12 = MACD_FAST_ALPHA;
+  const alpha26 = MACD_SLOW_ALPHA;
+  const alpha9 = MACD_SIGNAL_ALPHA;
+  let ema12 = prices[0];
+  let ema26 = prices[0];
+
+  // One MACD value per prefix of length >= 26; the signal only looks at the last 9 of them
+  const seriesLength = end - 25;
+  const signalStart = seriesLength >= 9 ? end - 9 : 25;
+  let signal = 0;
+  let macd = 0;
+
+  for (let i = 1; i < end; i++) {
+    ema12 = prices[i] * alpha12 + ema12 * (1 - alpha12);
+    ema26 = prices[i] * alpha26 + ema26 * (1 - alpha26);
+    if (i >= signalStart) {
+      macd = ema12 - ema26;
+      if (seriesLength < 9) {
+        signal += macd;
+      } else if (i === signalStart) {
+        signal = macd;
+      } else {
+        signal = macd * alpha9 + signal * (1 - alpha9);
+      }
+    }
+  }
+
+  macd = ema12 - ema26;
+  if (seriesLength < 9) {
+    signal /= seriesLength;
+  }
+
+  return { macd, signal };
+}
+
 /**
  * Calculate MACD (Moving Average Convergence Divergence)
  * 12/26/9 per spec Section 4
@@ -64,25 +189,20 @@ export function calculateMACD(
     return { macd: 0, signal: 0, histogram: 0 };
   }
 
-  const ema12 = calculateEMA(prices, 12);
-  const ema26 = calculateEMA(prices, 26);
-
-  const macd = ema12 - ema26;
-
-  // Build series of MACD values for signal calculation
-  const macdSeries: number[] = [];
-  for (let i = 26; i <= prices.length; i++) {
-    const slice = prices.slice(0, i);
-    const a12 = calculateEMA(slice, 12);
-    const a26 = calculateEMA(slice, 26);
-    macdSeries.push(a12 - a26);
-  }
-
-  const signal = macdSeries.length >= 9 ? calculateEMA(macdSeries.slice(-9), 9) : macdSeries.reduce((a, b) => a + b, 0) / macdSeries.length;
+  const { macd, signal } = computeMACD(prices, prices.length);
 
-  const histogram = macd - signal;
+  return { macd, signal, histogram: macd - signal };
+}
 
-  return { macd, signal, histogram };
+/**
+ * MACD histogram only, for callers that discard the MACD and signal lines
+ * Same value as calculateMACD(prices.slice(0, end)).histogram
+ * @param end Exclusive end index, to read a prefix of prices in place (default: all prices)
+ */
+export function calculateMACDHistogram(prices: number[], end: number = prices.length): number {
+  if (end < 26) return 0;
+  const { macd, signal } = computeMACD(prices, end);
+  return macd - signal;
 }
 
 /**
@@ -129,8 +249,12 @@ export function calculateVolumeRatio(volumes: number[]): number {
   const lookback = Math.min(20, Math.max(0, volumes.length - 1));
   if (lookback === 0) return 1;
 
-  const recentVolumes = volumes.slice(volumes.length - 1 - lookback, volumes.length - 1);
-  const avgVolume = recentVolumes.reduce((a, b) => a + b, 0) / recentVolumes.length;
+  // Sum the baseline window in place rather than slicing a copy of it
+  let sum = 0;
+  for (let i = volumes.length - 1 - lookback; i < volumes.length - 1; i++) {
+    sum += volumes[i];
+  }
+  const avgVolume = sum / lookback;
 
   if (avgVolume === 0) return 1;
 
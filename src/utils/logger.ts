@@ -0,0 +1,55 @@
+/**
+ * Leveled logger over console
+ * Messages below the configured level (LOG_LEVEL) are dropped before any formatting:
+ * pass values as printf-style arguments (logger.warn('failed for %s', ticker, error))
+ * rather than template literals so disabled levels cost only a comparison.
+ */
+
+import { getConfig } from '../config.js';
+
+export type LogLevel = 'debug' | 'info' | 'warn' | 'error' | 'silent';
+
+const LEVEL_ORDER: Record<LogLevel, number> = {
+  debug: 10,
+  info: 20,
+  warn: 30,
+  error: 40,
+  silent: 100,
+};
+
+export interface Logger {
+  debug(message: string, ...args: unknown[]): void;
+  info(message: string, ...args: unknown[]): void;
+  warn(message: string, ...args: unknown[]): void;
+  error(message: string, ...args: unknown[]): void;
+}
+
+let threshold: number | null = null;
+
+function enabled(level: LogLevel): boolean {
+  if (threshold === null) {
+    threshold = LEVEL_ORDER[getConfig().logLevel];
+  }
+  return LEVEL_ORDER[level] >= threshold;
+}
+
+/**
+ * Create a logger whose lines are prefixed with [name]
+ */
+export function createLogger(name: string): Logger {
+  const prefix = `[${name}] `;
+  return {
+    debug: (message, ...args) => {
+      if (enabled('debug')) console.debug(prefix + message, ...args);
+    },
+    info: (message, ...args) => {
+      if (enabled('info')) console.log(prefix + message, ...args);
+    },
+    warn: (message, ...args) => {
+      if (enabled('warn')) console.warn(prefix + message, ...args);
+    },
+    error: (message, ...args) => {
+      if (enabled('error')) console.error(prefix + message, ...args);
+    },
+  };
+}
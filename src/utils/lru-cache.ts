@@ -1,6 +1,7 @@
 /**
  * Simple LRU cache with TTL support and max size eviction.
  * Prevents unbounded memory growth from API response caching.
+ * Ages are measured on the monotonic clock so wall-clock adjustments can't extend or expire entries.
  */
 export class LRUCache<T> {
   private cache: Map<string, { data: T; timestamp: number }> = new Map();
@@ -14,7 +15,7 @@ export class LRUCache<T> {
     const entry = this.cache.get(key);
     if (!entry) return null;
 
-    if (Date.now() - entry.timestamp >= expiryMs) {
+    if (performance.now() - entry.timestamp >= expiryMs) {
       this.cache.delete(key);
       return null;
     }
@@ -37,7 +38,7 @@ export class LRUCache<T> {
       }
     }
 
-    this.cache.set(key, { data, timestamp: Date.now() });
+    this.cache.set(key, { data, timestamp: performance.now() });
   }
 
   get size(): number {
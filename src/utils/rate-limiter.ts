@@ -2,6 +2,7 @@
  * Token-bucket rate limiter for API services with daily request limits.
  * Refills tokens continuously throughout the day.
  * Uses a promise queue to prevent race conditions from concurrent callers.
+ * Refill is timed with the monotonic clock (performance.now), immune to system clock jumps.
  */
 export class RateLimiter {
   private tokens: number;
@@ -14,7 +15,7 @@ export class RateLimiter {
     this.maxTokens = maxRequestsPerDay;
     this.tokens = maxRequestsPerDay;
     this.refillRate = maxRequestsPerDay / (24 * 60 * 60 * 1000);
-    this.lastRefill = Date.now();
+    this.lastRefill = performance.now();
   }
 
   async acquire(): Promise<void> {
@@ -46,7 +47,7 @@ export class RateLimiter {
   }
 
   private refill(): void {
-    const now = Date.now();
+    const now = performance.now();
     const elapsed = now - this.lastRefill;
     this.tokens = Math.min(this.maxTokens, this.tokens + elapsed * this.refillRate);
     this.lastRefill = now;
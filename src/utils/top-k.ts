@@ -0,0 +1,32 @@
+/**
+ * Top-K selection without sorting the whole input
+ * O(n·k) with a k-length buffer, which beats a full O(n log n) sort for the small k used here
+ * (e.g. top 10 of a watchlist, or maxPositions of a backtest universe).
+ */
+
+/**
+ * Return the k highest-scoring items, highest first
+ * Ties keep their input order, matching a stable descending sort followed by slice(0, k).
+ */
+export function topK<T>(items: Iterable<T>, k: number, score: (item: T) => number): T[] {
+  const best: T[] = [];
+  const bestScores: number[] = [];
+  if (k <= 0) return best;
+
+  for (const item of items) {
+    const s = score(item);
+    if (best.length === k && !(s > bestScores[k - 1])) continue;
+
+    // Insert after every kept item scoring >= s (stable for ties)
+    let i = best.length;
+    while (i > 0 && bestScores[i - 1] < s) i--;
+    best.splice(i, 0, item);
+    bestScores.splice(i, 0, s);
+    if (best.length > k) {
+      best.pop();
+      bestScores.pop();
+    }
+  }
+
+  return best;
+}
@@ -4,6 +4,10 @@ export default defineConfig({
   test: {
     environment: 'node',
     include: ['src/**/*.test.ts', 'src/**/*.spec.ts'],
+    env: {
+      // Empty disables the on-disk candle cache, so test runs never write under $HOME
+      MARKET_DATA_CACHE_DIR: '',
+    },
     coverage: {
       provider: 'v8',
       reporter: ['text', 'json', 'html'],